@@ -1,3 +1,7 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 from github_api_client import generate_github_api_client
 from twitter_api_client import generate_twitter_api_client
 from stripe_api_client import generate_stripe_api_client
@@ -5,24 +9,39 @@ from spotify_api_client import generate_spotify_api_client
 from openweathermap_api_client import generate_openweathermap_api_client
 
 
-def generate_all_clients():
-    print("Generating GitHub API Client...")
-    generate_github_api_client()
-
-    print("Generating Twitter API Client...")
-    generate_twitter_api_client()
-
-    print("Generating Stripe API Client...")
-    generate_stripe_api_client()
-
-    print("Generating Spotify API Client...")
-    generate_spotify_api_client()
+CLIENT_GENERATORS = [
+    ("GitHub", generate_github_api_client),
+    ("Twitter", generate_twitter_api_client),
+    ("Stripe", generate_stripe_api_client),
+    ("Spotify", generate_spotify_api_client),
+    ("OpenWeatherMap", generate_openweathermap_api_client),
+]
 
-    print("Generating OpenWeatherMap API Client...")
-    generate_openweathermap_api_client()
 
+def generate_all_clients():
+    # Each driver parses its own spec and writes its own files, so they can
+    # run in separate processes without sharing any state.
+    max_workers = min(len(CLIENT_GENERATORS), os.cpu_count() or 1)
+    failed = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fn): name for name, fn in CLIENT_GENERATORS}
+        # Progress is reported as each client finishes, in completion order.
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                failed.append(name)
+                print(f"Failed to generate {name} API Client: {e}")
+            else:
+                print(f"Generated {name} API Client")
+
+    if failed:
+        print(f"Failed API clients: {', '.join(failed)}")
+        return False
     print("All API clients generated successfully!")
+    return True
 
 
 if __name__ == "__main__":
-    generate_all_clients()
+    sys.exit(0 if generate_all_clients() else 1)
@@ -1,5 +1,13 @@
 import asyncio
 from github_client import GitHubClient
+from salim_api_gen.exceptions import (
+    APIError,
+    HTTPError,
+    InvalidParameterError,
+    JSONDecodeError,
+)
+
+MAX_CONCURRENT_REQUESTS = 10
 
 
 async def main():
@@ -13,9 +21,24 @@ async def main():
 
         # List repositories for the authenticated user
         repos = await client.list_repositories_for_authenticated_user()
+
+        # Fetch repository details concurrently over the client's pooled
+        # session, bounded so we stay well inside GitHub's rate limits.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def get_repo(repo):
+            async with semaphore:
+                return await client.get_repo(owner=user["login"], repo=repo["name"])
+
+        details = await asyncio.gather(
+            *(get_repo(repo) for repo in repos), return_exceptions=True
+        )
         print("Your repositories:")
-        for repo in repos:
-            print(f"- {repo['name']}")
+        for repo, detail in zip(repos, details):
+            if isinstance(detail, Exception):
+                print(f"- {repo['name']} (failed to fetch details: {detail})")
+            else:
+                print(f"- {repo['name']} ({detail.get('stargazers_count', 0)} stars)")
 
         # Create a new repository
         new_repo = await client.create_repository(
@@ -1,17 +1,22 @@
+from typing import Dict
+
 PLUGIN_NAME = "custom_header"
 
+_MARKER = "# __SALIM_HEADERS__"
+_INDENT = " " * 12
+
+
+def add_custom_headers(client_code: str, headers: Dict[str, str]) -> str:
+    """Add several custom headers to the API client in a single pass."""
+    header_lines = "".join(
+        f"\n{_INDENT}'{name}': '{value}'," for name, value in headers.items()
+    )
+    return client_code.replace(_MARKER, _MARKER + header_lines, 1)
+
 
 def add_custom_header(client_code: str, header_name: str, header_value: str) -> str:
     """Add a custom header to the API client."""
-    header_line = f"        '{header_name}': '{header_value}',"
-    insertion_point = client_code.index("headers = {")
-    insertion_index = client_code.index("\n", insertion_point) + 1
-    return (
-        client_code[:insertion_index]
-        + header_line
-        + "\n"
-        + client_code[insertion_index:]
-    )
+    return add_custom_headers(client_code, {header_name: header_value})
 
 
 def register_plugin():
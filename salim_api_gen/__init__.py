@@ -1,5 +1,3 @@
-from .generator import APIGenerator
-from .parser import OpenAPIParser
 from .exceptions import (
     SalimAPIGenException,
     ValidationError,
@@ -27,3 +25,17 @@ __all__ = [
 ]
 
 __version__ = "0.5.0"
+
+
+def __getattr__(name):
+    # Import the generator and parser (and their aiohttp, jinja2, FastAPI
+    # dependencies) only when they are first used.
+    if name == "APIGenerator":
+        from .generator import APIGenerator
+
+        return APIGenerator
+    if name == "OpenAPIParser":
+        from .parser import OpenAPIParser
+
+        return OpenAPIParser
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
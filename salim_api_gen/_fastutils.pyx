@@ -0,0 +1,31 @@
+# cython: language_level=3
+"""
+Compiled helpers for salim_api_gen.utils.
+
+The module is optional: utils.py falls back to equivalent pure-Python code
+when the extension has not been built.
+"""
+
+
+cpdef dict merge_dicts(dict dict1, dict dict2):
+    """
+    Merge two dictionaries recursively.
+
+    Nested dictionaries are walked with an explicit stack, so deeply nested
+    schemas cannot hit the recursion limit. Sub-dictionaries taken from dict2
+    are copied rather than shared with the result.
+    """
+    cdef list stack = [(dict1, dict2)]
+    cdef object target, source, key, value, existing
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                existing = target.get(key)
+                if not isinstance(existing, dict):
+                    existing = {}
+                    target[key] = existing
+                stack.append((existing, value))
+            else:
+                target[key] = value
+    return dict1
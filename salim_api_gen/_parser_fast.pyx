@@ -0,0 +1,43 @@
+# cython: language_level=3
+"""
+Compiled helpers for the hot loops of salim_api_gen.parser.
+
+The module is optional: parser.py falls back to equivalent pure-Python code
+when the extension has not been built.
+"""
+
+from urllib.parse import unquote
+
+
+cpdef object walk_pointer(dict root, str ref):
+    """
+    Follow a local reference such as "#/components/schemas/Pet" from root.
+
+    The fragment is a percent-encoded RFC 6901 JSON pointer: "~1" and "~0"
+    stand for "/" and "~", and numeric tokens index into lists. Missing
+    keys and non-container nodes resolve to an empty dict.
+    """
+    cdef object node = root
+    cdef list parts
+    cdef Py_ssize_t i, n
+    cdef object index
+    cdef str part
+    if "%" in ref:
+        ref = unquote(ref)
+    parts = ref.split("/")
+    n = len(parts)
+    for i in range(1, n):
+        part = parts[i]
+        if "~" in part:
+            part = part.replace("~1", "/").replace("~0", "~")
+        if type(node) is dict:
+            node = (<dict>node).get(part, {})
+        elif isinstance(node, dict):
+            node = node.get(part, {})
+        elif isinstance(node, list) and part.isascii() and part.isdigit():
+            # Compare as a Python int: a long token must not overflow.
+            index = int(part)
+            node = (<list>node)[index] if index < len(<list>node) else {}
+        else:
+            node = {}
+    return node
@@ -1,36 +1,106 @@
 import asyncio
-import json
+import importlib.util
+import os
+import sys
+import tempfile
+import uuid
 import click
 from .generator import APIGenerator
+from .utils import _loads_json, save_json
+
+
+MAX_CONCURRENT_REQUESTS = 20
+
+
+def _expand_endpoints(endpoints):
+    """Expand "@file.txt" entries into the endpoints listed in that file."""
+    expanded = []
+    for endpoint in endpoints:
+        if endpoint.startswith("@"):
+            with open(endpoint[1:], "r") as f:
+                expanded.extend(line.strip() for line in f if line.strip())
+        else:
+            expanded.append(endpoint)
+    return expanded
+
+
+def _load_client_module(client_file):
+    """
+    Import a freshly generated client under a unique module name.
+
+    The module lives in the salim_api_gen package so the client's relative
+    imports of .exceptions and .validation resolve, and a unique name means a
+    long-running process always sees the newly generated code.
+    """
+    module_name = f"{__package__}._salim_tmp_{uuid.uuid4().hex}"
+    spec = importlib.util.spec_from_file_location(module_name, client_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
 
 
 @click.command()
 @click.option("--spec", required=True, help="Path to the API specification file")
-@click.option("--endpoint", required=True, help="API endpoint to test")
+@click.option(
+    "--endpoint",
+    required=True,
+    multiple=True,
+    help="API endpoint to test; repeat it, or pass @file.txt with one per line",
+)
 @click.option("--method", default="GET", help="HTTP method to use")
 @click.option("--data", help="JSON data to send with the request")
 @click.option("--output", default="response.json", help="Output file for the response")
 def test_api(spec, endpoint, method, data, output):
-    """Test an API endpoint using the generated client."""
-    click.echo(f"Testing API endpoint: {endpoint}")
-
-    generator = APIGenerator(spec)
-    generator.generate("temp_client.py")
-
-    from temp_client import APIClient
-
-    async def run_test():
-        async with APIClient("https://api.example.com") as client:
-            method_to_call = getattr(client, endpoint.replace("/", "_"))
-            kwargs = {}
-            if data:
-                kwargs["data"] = json.loads(data)
-            response = await method_to_call(**kwargs)
-            with open(output, "w") as f:
-                json.dump(response, f, indent=2)
-            click.echo(f"Response saved to {output}")
-
-    asyncio.run(run_test())
+    """Test one or more API endpoints using the generated client."""
+    endpoints = _expand_endpoints(endpoint)
+    click.echo(f"Testing API endpoint(s): {', '.join(endpoints)}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client_file = os.path.join(tmpdir, "temp_client.py")
+        generator = APIGenerator(spec)
+        generator.generate(client_file)
+        module = _load_client_module(client_file)
+    try:
+        asyncio.run(_run_test(module.APIClient, endpoints, method, data, output))
+    finally:
+        sys.modules.pop(module.__name__, None)
+
+
+async def _run_test(client_class, endpoints, method, data, output):
+    kwargs = {}
+    if data:
+        kwargs["data"] = _loads_json(data.encode("utf-8"))
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async with client_class("https://api.example.com") as client:
+
+        async def call(endpoint):
+            async with semaphore:
+                operation = client._DISPATCH.get(f"{method.upper()} {endpoint}")
+                if operation is not None:
+                    return await operation(client, **kwargs)
+                method_to_call = getattr(client, endpoint.replace("/", "_"))
+                return await method_to_call(**kwargs)
+
+        results = await asyncio.gather(
+            *(call(e) for e in endpoints), return_exceptions=True
+        )
+
+    results = [
+        {"endpoint": e, "error": str(result)}
+        if isinstance(result, Exception)
+        else result
+        for e, result in zip(endpoints, results)
+    ]
+    response = results[0] if len(results) == 1 else results
+    # save_json keeps big integers and NaN exactly as the API returned them.
+    save_json(response, output)
+    click.echo(f"Response saved to {output}")
 
 
 if __name__ == "__main__":
@@ -1,25 +1,43 @@
-import aiohttp
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    import aiohttp
 
 
 class OAuth2Handler:
     def __init__(self):
         self.token: Dict[str, Any] = {}
+        self._session: "Optional[aiohttp.ClientSession]" = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # One pooled session per handler so token refreshes reuse the
+        # keep-alive connection instead of a fresh TCP/TLS handshake.
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300)
+            )
+        return self._session
 
     async def get_token(
         self, token_url: str, client_id: str, client_secret: str, scope: str
     ) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as session:
-            data = {
-                "grant_type": "client_credentials",
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "scope": scope,
-            }
-            async with session.post(token_url, data=data) as response:
-                response.raise_for_status()
-                self.token = await response.json()
-                return self.token
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "scope": scope,
+        }
+        async with self._get_session().post(token_url, data=data) as response:
+            response.raise_for_status()
+            self.token = await response.json()
+            return self.token
 
     def get_auth_header(self) -> Dict[str, str]:
         return {"Authorization": f"Bearer {self.token.get('access_token', '')}"}
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
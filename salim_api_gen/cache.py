@@ -1,20 +1,27 @@
 import time
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Any, Tuple
 
 
 class APICache:
-    def __init__(self, ttl: int = 300):
-        self.cache: Dict[str, Any] = {}
+    def __init__(self, ttl: int = 300, maxsize: int = 10_000):
+        self.cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
         self.ttl = ttl
+        self.maxsize = maxsize
 
     def get(self, key: str) -> Any:
-        if key in self.cache:
-            value, timestamp = self.cache[key]
-            if time.time() - timestamp < self.ttl:
-                return value
-            else:
-                del self.cache[key]
-        return None
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self.cache[key]
+            return None
+        self.cache.move_to_end(key)
+        return value
 
     def set(self, key: str, value: Any):
-        self.cache[key] = (value, time.time())
+        self.cache[key] = (value, time.monotonic() + self.ttl)
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
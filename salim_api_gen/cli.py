@@ -1,13 +1,18 @@
 import argparse
+import hashlib
+import json
 import logging
 import os
-from typing import List, Dict, Any
-from .generator import APIGenerator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Dict, Any, Optional
 from .utils import ensure_directory
 from .exceptions import SalimAPIGenException
-import inquirer
 from .plugin_manager import plugin_manager
-from .api_tester import test_api
+from . import __version__
+
+_SPEC_SUFFIXES = frozenset({".json", ".yaml", ".yml"})
+_MANIFEST_NAME = ".salim-api-gen.cache.json"
+_DEFAULT_TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
 
 
 def setup_logging(verbose: bool):
@@ -64,10 +69,18 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         "--list-plugins", action="store_true", help="List available plugins"
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="Number of worker processes used when processing a directory",
+    )
     return parser.parse_args()
 
 
 def interactive_mode() -> Dict[str, Any]:
+    import inquirer
+
     questions = [
         inquirer.Text(
             "input",
@@ -115,6 +128,44 @@ def interactive_mode() -> Dict[str, Any]:
     return answers
 
 
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+def _template_digest(template_dir: str, template_name: Optional[str]) -> str:
+    # Templates missing from a custom directory fall back to the built-ins, so
+    # both copies count towards the fingerprint.
+    if not template_name:
+        return ""
+    digests = []
+    for directory in dict.fromkeys((template_dir, _DEFAULT_TEMPLATE_DIR)):
+        template_path = os.path.join(directory, template_name)
+        if os.path.isfile(template_path):
+            digests.append(_file_digest(template_path))
+    return ":".join(digests)
+
+
+def _load_manifest(out_dir: str) -> Dict[str, Any]:
+    """
+    Load the fingerprints recorded by the previous run for out_dir.
+    """
+    try:
+        with open(os.path.join(out_dir or ".", _MANIFEST_NAME), "r") as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_manifest(out_dir: str, manifest: Dict[str, Any]) -> None:
+    """
+    Persist output fingerprints so unchanged outputs are skipped next time.
+    """
+    os.makedirs(out_dir or ".", exist_ok=True)
+    with open(os.path.join(out_dir or ".", _MANIFEST_NAME), "w") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+
+
 def generate_wrapper(
     input_file: str,
     output_file: str,
@@ -127,45 +178,94 @@ def generate_wrapper(
     spec_format: str = "openapi",
     plugins_dir: str = None,
     execute_plugin: str = None,
-):
+    manifest: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Generate the requested outputs for input_file, skipping every output whose
+    spec, template and API version fingerprint matches the manifest.
+
+    When no manifest is passed, the one next to output_file is loaded and saved.
+    Returns the manifest entries for the outputs that were regenerated.
+    """
+    from .generator import APIGenerator
+
     logging.info(f"Generating API wrapper for {input_file}")
     ensure_directory(output_file)
+    output_dir = os.path.dirname(output_file)
+    owns_manifest = manifest is None
+    if owns_manifest:
+        manifest = _load_manifest(output_dir)
+    updates: Dict[str, Any] = {}
     try:
-        generator = APIGenerator(
-            input_file,
-            template_file,
-            api_version=api_version,
-            spec_format=spec_format,
-            plugins_dir=plugins_dir,
-        )
-        generator.generate(output_file)
-        logging.info(f"API wrapper generated: {output_file}")
+        spec_digest = _file_digest(input_file)
+        template_dir = template_file or _DEFAULT_TEMPLATE_DIR
+        outputs = [
+            (True, output_file, "client.py.jinja2", "generate", "API wrapper"),
+            (
+                generate_mock,
+                os.path.join(output_dir, "mock_server"),
+                "mock_server.py.jinja2",
+                "generate_mock_server",
+                "Mock server",
+            ),
+            (
+                generate_docs,
+                os.path.join(output_dir, "api_documentation.md"),
+                "docs.md.jinja2",
+                "generate_documentation",
+                "API documentation",
+            ),
+            (
+                generate_sync,
+                os.path.join(output_dir, "sync_client.py"),
+                "client.py.jinja2",
+                "generate_sync_client",
+                "Synchronous API client",
+            ),
+            (
+                generate_js,
+                os.path.join(output_dir, "js_client.js"),
+                "js_client.js.jinja2",
+                "generate_js_client",
+                "JavaScript API client",
+            ),
+        ]
 
-        if generate_mock:
-            mock_output_dir = os.path.join(os.path.dirname(output_file), "mock_server")
-            generator.generate_mock_server(mock_output_dir)
-            logging.info(f"Mock server generated: {mock_output_dir}")
-
-        if generate_docs:
-            docs_output_file = os.path.join(
-                os.path.dirname(output_file), "api_documentation.md"
-            )
-            generator.generate_documentation(docs_output_file)
-            logging.info(f"API documentation generated: {docs_output_file}")
-
-        if generate_sync:
-            sync_output_file = os.path.join(
-                os.path.dirname(output_file), "sync_client.py"
-            )
-            generator.generate_sync_client(sync_output_file)
-            logging.info(f"Synchronous API client generated: {sync_output_file}")
-
-        if generate_js:
-            js_output_file = os.path.join(os.path.dirname(output_file), "js_client.js")
-            generator.generate_js_client(js_output_file)
-            logging.info(f"JavaScript API client generated: {js_output_file}")
+        generator = None
+        for enabled, path, template_name, method, label in outputs:
+            if not enabled:
+                continue
+            fingerprint = [
+                spec_digest,
+                _template_digest(template_dir, template_name),
+                api_version,
+                __version__,
+            ]
+            key = os.path.abspath(path)
+            if manifest.get(key) == fingerprint and os.path.exists(path):
+                logging.info(f"{label} is up to date: {path}")
+                continue
+            if generator is None:
+                generator = APIGenerator(
+                    input_file,
+                    template_file,
+                    api_version=api_version,
+                    spec_format=spec_format,
+                    plugins_dir=plugins_dir,
+                )
+            getattr(generator, method)(path)
+            updates[key] = fingerprint
+            logging.info(f"{label} generated: {path}")
 
         if execute_plugin:
+            if generator is None:
+                generator = APIGenerator(
+                    input_file,
+                    template_file,
+                    api_version=api_version,
+                    spec_format=spec_format,
+                    plugins_dir=plugins_dir,
+                )
             plugin_result = generator.execute_plugin(execute_plugin, output_file)
             logging.info(f"Plugin '{execute_plugin}' executed: {plugin_result}")
 
@@ -176,6 +276,28 @@ def generate_wrapper(
             f"Unexpected error generating API wrapper for {input_file}: {str(e)}"
         )
 
+    if owns_manifest and updates:
+        manifest.update(updates)
+        _save_manifest(output_dir, manifest)
+    return updates
+
+
+def _iter_specs(root: str, recursive: bool) -> Iterator[str]:
+    """
+    Yield the specification files under root, descending into subdirectories
+    only when recursive is set.
+    """
+    with os.scandir(root) as entries:
+        subdirs = []
+        for entry in entries:
+            if entry.is_file():
+                if os.path.splitext(entry.name)[1] in _SPEC_SUFFIXES:
+                    yield entry.path
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    for subdir in subdirs:
+        yield from _iter_specs(subdir, recursive)
+
 
 def process_input(
     input_path: str,
@@ -190,8 +312,9 @@ def process_input(
     spec_format: str = "openapi",
     plugins_dir: str = None,
     execute_plugin: str = None,
+    max_workers: int = None,
 ) -> List[str]:
-    processed_files = []
+    jobs = []
     if os.path.isfile(input_path):
         output_file = (
             output_path
@@ -200,67 +323,60 @@ def process_input(
                 output_path, os.path.basename(input_path).rsplit(".", 1)[0] + ".py"
             )
         )
-        generate_wrapper(
-            input_path,
-            output_file,
-            template_file,
-            generate_mock,
-            generate_docs,
-            generate_sync,
-            generate_js,
-            api_version,
-            spec_format,
-            plugins_dir,
-            execute_plugin,
-        )
-        processed_files.append(output_file)
+        jobs.append((input_path, output_file))
     elif os.path.isdir(input_path):
-        if recursive:
-            for root, _, files in os.walk(input_path):
-                for file in files:
-                    if file.endswith((".json", ".yaml", ".yml")):
-                        input_file = os.path.join(root, file)
-                        rel_path = os.path.relpath(input_file, input_path)
-                        output_file = os.path.join(
-                            output_path, os.path.splitext(rel_path)[0] + ".py"
-                        )
-                        generate_wrapper(
-                            input_file,
-                            output_file,
-                            template_file,
-                            generate_mock,
-                            generate_docs,
-                            generate_sync,
-                            generate_js,
-                            api_version,
-                            spec_format,
-                            plugins_dir,
-                            execute_plugin,
-                        )
-                        processed_files.append(output_file)
-        else:
-            for file in os.listdir(input_path):
-                if file.endswith((".json", ".yaml", ".yml")):
-                    input_file = os.path.join(input_path, file)
-                    output_file = os.path.join(
-                        output_path, os.path.splitext(file)[0] + ".py"
-                    )
-                    generate_wrapper(
-                        input_file,
-                        output_file,
-                        template_file,
-                        generate_mock,
-                        generate_docs,
-                        generate_sync,
-                        generate_js,
-                        api_version,
-                        spec_format,
-                        plugins_dir,
-                        execute_plugin,
-                    )
-                    processed_files.append(output_file)
+        for input_file in _iter_specs(input_path, recursive):
+            rel_path = os.path.relpath(input_file, input_path)
+            output_file = os.path.join(
+                output_path, os.path.splitext(rel_path)[0] + ".py"
+            )
+            jobs.append((input_file, output_file))
     else:
         logging.error(f"Invalid input path: {input_path}")
+
+    options = (
+        template_file,
+        generate_mock,
+        generate_docs,
+        generate_sync,
+        generate_js,
+        api_version,
+        spec_format,
+        plugins_dir,
+        execute_plugin,
+    )
+    if os.path.isfile(input_path) and jobs:
+        manifest_dir = os.path.dirname(jobs[0][1])
+    else:
+        manifest_dir = output_path
+    manifest = _load_manifest(manifest_dir)
+    updates: Dict[str, Any] = {}
+    if len(jobs) <= 1 or max_workers == 1:
+        for input_file, output_file in jobs:
+            updates.update(
+                generate_wrapper(input_file, output_file, *options, manifest=manifest)
+            )
+    else:
+        # Each spec is parsed and rendered independently, so fan the work out
+        # across processes to use every core.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    generate_wrapper,
+                    input_file,
+                    output_file,
+                    *options,
+                    manifest=manifest,
+                )
+                for input_file, output_file in jobs
+            ]
+            for future in futures:
+                updates.update(future.result())
+    if updates:
+        manifest.update(updates)
+        _save_manifest(manifest_dir, manifest)
+
+    processed_files = [output_file for _, output_file in jobs]
     return processed_files
 
 
@@ -313,6 +429,7 @@ def main():
         args.spec_format,
         args.plugins_dir,
         args.execute_plugin,
+        args.workers,
     )
 
     if processed_files:
@@ -321,6 +438,7 @@ def main():
         logging.warning("No files were processed")
 
     import click
+    from .api_tester import test_api
 
     cli = click.CommandCollection(sources=[test_api])
     cli.add_command(test_api)
@@ -1,26 +1,169 @@
+import functools
 import os
 import asyncio
-import aiohttp
+from concurrent.futures import ThreadPoolExecutor
 import jinja2
-from typing import Dict, Any, List, Optional
-from .parser import create_parser, BaseSpecParser
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+from .parser import create_parser, BaseSpecParser, build_endpoint_views
 from .exceptions import (
     RateLimitExceeded,
     ConfigurationError,
 )
-from ratelimit import limits, sleep_and_retry
 from .auth import OAuth2Handler
 from .pagination import PaginationHandler
 from .cache import APICache
 from .webhook import WebhookHandler
-from .mock_server import MockServerGenerator
+from .mock_server import MockServerGenerator, _HTTP_METHODS
 import re
-import markdown2
 import logging
 from .js_generator import JavaScriptGenerator
 from .plugin_manager import plugin_manager
-from .throttling import DynamicAPIThrottler
+from .throttling import AsyncTokenBucket, DynamicAPIThrottler
 from .error_handler import ErrorHandler
+from .utils import atomic_open, atomic_write_bytes, atomic_write_chunks
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_DEFAULT_TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+_PATH_PARAM_RE = re.compile(r"\{([^}]+)\}")
+_SNAKE_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Every async-to-sync rewrite in one alternation, so the generated client is
+# scanned once. The alternatives never overlap, and await response.read()
+# is listed before the generic await so it wins at the same position.
+_SYNC_RE = re.compile(
+    r"(?P<asyncdef>async def)"
+    r"|(?P<read>await response\.read\(\))"
+    r"|(?P<await>await )(?=[^\n]*\()"
+    r"|(?P<import>import aiohttp)"
+    r"|(?P<session>aiohttp\.ClientSession\(.*\)$)"
+    r"|(?P<asyncwith>async with )(?=[^\n]*? as [^\n]*?:)",
+    re.MULTILINE,
+)
+_SYNC_REPLACEMENTS = {
+    "asyncdef": "def",
+    "read": "response.content",
+    "await": "",
+    "import": "import requests",
+    "session": "requests.Session()",
+    "asyncwith": "with ",
+}
+
+
+def _sync_replacement(match: "re.Match") -> str:
+    return _SYNC_REPLACEMENTS[match.lastgroup]
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_camel_case(string: str) -> str:
+    """Convert a string to camelCase."""
+    words = string.split("_")
+    return words[0] + "".join(word.capitalize() for word in words[1:])
+
+
+@functools.lru_cache(maxsize=4096)
+def _to_snake_case(string: str) -> str:
+    """Convert a string to snake_case."""
+    return _SNAKE_RE.sub("_", string).lower()
+
+
+@functools.lru_cache(maxsize=1)
+def _markdown_renderer():
+    """
+    Return a Markdown-to-HTML function, importing the converter on first use.
+
+    markdown-it-py is preferred; its CommonMark parser is built once so the
+    rule chains are compiled once. markdown2 is the fallback.
+    """
+    try:
+        from markdown_it import MarkdownIt
+    except ImportError:
+        import markdown2
+
+        return markdown2.markdown
+    return MarkdownIt("commonmark", {"html": False}).render
+
+
+def _render_markdown(text: str) -> str:
+    """Convert Markdown to HTML."""
+    return _markdown_renderer()(text)
+
+
+@functools.lru_cache(maxsize=8)
+def _template_env(template_dir: str) -> jinja2.Environment:
+    """
+    Build the Jinja2 environment for a template directory once per process.
+
+    Environments keep their own cache of compiled templates, so sharing one
+    across APIGenerator instances means each template is compiled only once.
+    """
+    env = jinja2.Environment(
+        # Templates missing from a custom directory fall back to the built-ins.
+        loader=jinja2.FileSystemLoader([template_dir, _DEFAULT_TEMPLATE_DIR]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # Compiled templates are cached on disk so later processes skip
+        # lexing, parsing and code generation of unchanged templates. With no
+        # directory Jinja uses a private per-user 0700 directory and checks
+        # its owner, so other local users can neither plant nor block entries.
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+    env.filters["camel_case"] = _to_camel_case
+    env.filters["snake_case"] = _to_snake_case
+    env.filters["path_segments"] = APIGenerator.split_path
+    env.globals["zip"] = zip
+    return env
+
+
+# One pooled session shared by every APIGenerator._request call, so requests
+# reuse keep-alive connections instead of paying a TCP/TLS handshake each.
+# The lock is created lazily because asyncio primitives bind to the running
+# loop, and both are replaced if a later asyncio.run() starts a new loop.
+_SESSION: "Optional[aiohttp.ClientSession]" = None
+_SESSION_LOCK: Optional[asyncio.Lock] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_shared_session() -> "aiohttp.ClientSession":
+    global _SESSION, _SESSION_LOCK, _SESSION_LOOP
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    if _SESSION_LOOP is not loop:
+        _SESSION, _SESSION_LOCK, _SESSION_LOOP = None, asyncio.Lock(), loop
+    async with _SESSION_LOCK:
+        if _SESSION is None or _SESSION.closed:
+            _SESSION = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=10,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=aiohttp.ClientTimeout(total=60, connect=10),
+            )
+    return _SESSION
+
+
+async def aclose():
+    """
+    Close the shared session used by APIGenerator._request.
+    """
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
 
 
 class APIGenerator:
@@ -36,60 +179,85 @@ class APIGenerator:
         self.logger = logging.getLogger(__name__)
         self.parser: BaseSpecParser = create_parser(spec_file, spec_format)
         self.api_data: Dict[str, Any] = {}
-        self.template_dir = template_dir or os.path.join(
-            os.path.dirname(__file__), "templates"
-        )
-        self.template_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(self.template_dir),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        self.template_env.filters["camel_case"] = self.to_camel_case
-        self.template_env.filters["snake_case"] = self.to_snake_case
+        self.template_dir = template_dir or _DEFAULT_TEMPLATE_DIR
+        self.template_env = _template_env(os.path.abspath(self.template_dir))
+        self._client_template: Optional[jinja2.Template] = None
+        self._endpoint_template: Optional[jinja2.Template] = None
+        self._context: Optional[Dict[str, Any]] = None
         self.oauth_handler = OAuth2Handler()
         self.pagination_handler = PaginationHandler()
         self.cache = APICache()
         self.webhook_handler = WebhookHandler()
-        self.mock_server_generator = MockServerGenerator()
+        self.mock_server_generator = MockServerGenerator(
+            template_env=self.template_env
+        )
         self.custom_headers = custom_headers or {}
-        self.js_generator = JavaScriptGenerator(self.template_dir)
+        self.js_generator = JavaScriptGenerator(
+            self.template_dir, template_env=self.template_env
+        )
         if plugins_dir:
             plugin_manager.load_plugins(plugins_dir)
         self.throttler = DynamicAPIThrottler(
             initial_rate_limit=5, initial_time_period=1
         )
         self.error_handler = ErrorHandler()
+        self._bucket = AsyncTokenBucket(rate=5, per=1)  # 5 calls per second
+
+    def _ensure_parsed(self) -> Dict[str, Any]:
+        """
+        Parse the specification on first use and reuse it for every artifact.
+        """
+        if not self.api_data:
+            self.api_data = self.parser.parse()
+        return self.api_data
+
+    @property
+    def parsed_spec(self) -> Dict[str, Any]:
+        """
+        The parsed specification, shared by every generate_* method.
+        """
+        return self._ensure_parsed()
+
+    def _get_client_template(self) -> jinja2.Template:
+        """
+        Load the client template once and share it between the async and sync clients.
+        """
+        if self._client_template is None:
+            self._client_template = self.template_env.get_template("client.py.jinja2")
+        return self._client_template
+
+    def _render_context(self) -> Dict[str, Any]:
+        """
+        Build the client template context once and reuse it for every render.
+        """
+        if self._context is None:
+            self._ensure_parsed()
+            self._context = {
+                "api_info": self.parser.get_api_info(),
+                "endpoints": self.parser.get_endpoints(),
+                "endpoint_views": build_endpoint_views(self.parser.get_endpoints()),
+                "servers": self.parser.get_servers(),
+                "security_schemes": self.parser.get_security_schemes(),
+                "tags": self.parser.get_tags(),
+                "external_docs": self.parser.get_external_docs(),
+                "parser": self.parser,
+                "oauth_handler": self.oauth_handler,
+                "pagination_handler": self.pagination_handler,
+                "cache": self.cache,
+                "webhook_handler": self.webhook_handler,
+            }
+        return self._context
 
     def generate(self, output_file: str):
         """
         Generate the API client code and write it to the output file.
         """
         try:
-            self.api_data = self.parser.parse()
-            api_info = self.parser.get_api_info()
-            endpoints = self.parser.get_endpoints()
-            servers = self.parser.get_servers()
-            security_schemes = self.parser.get_security_schemes()
-            tags = self.parser.get_tags()
-            external_docs = self.parser.get_external_docs()
-
-            template = self.template_env.get_template("client.py.jinja2")
-            rendered_code = template.render(
-                api_info=api_info,
-                endpoints=endpoints,
-                servers=servers,
-                security_schemes=security_schemes,
-                tags=tags,
-                external_docs=external_docs,
-                parser=self.parser,
-                oauth_handler=self.oauth_handler,
-                pagination_handler=self.pagination_handler,
-                cache=self.cache,
-                webhook_handler=self.webhook_handler,
-            )
-
-            with open(output_file, "w") as file:
-                file.write(rendered_code)
+            # Write chunks as they are rendered instead of holding the whole
+            # client in memory.
+            template = self._get_client_template()
+            with atomic_open(output_file) as file:
+                template.stream(**self._render_context()).dump(file, encoding="utf-8")
 
             self.logger.info(f"API client generated successfully: {output_file}")
         except Exception as e:
@@ -101,6 +269,7 @@ class APIGenerator:
         Generate a mock server based on the OpenAPI specification.
         """
         try:
+            self._ensure_parsed()
             self.mock_server_generator.generate(self.api_data, output_dir)
             self.logger.info(f"Mock server generated successfully: {output_dir}")
         except Exception as e:
@@ -112,38 +281,20 @@ class APIGenerator:
         Generate API documentation in Markdown and HTML formats.
         """
         try:
-            doc = f"# {self.api_data['info']['title']} v{self.api_data['info']['version']}\n\n"
-            doc += f"{self.api_data['info']['description']}\n\n"
-
-            for path, methods in self.api_data["paths"].items():
-                for method, details in methods.items():
-                    doc += f"## {method.upper()} {path}\n\n"
-                    doc += f"{details.get('summary', '')}\n\n"
-                    doc += f"{details.get('description', '')}\n\n"
-
-                    if details.get("parameters"):
-                        doc += "### Parameters\n\n"
-                        for param in details["parameters"]:
-                            doc += f"- `{param['name']}` ({param['in']}): {param.get('description', '')}\n"
-                        doc += "\n"
-
-                    if "requestBody" in details:
-                        doc += "### Request Body\n\n"
-                        doc += f"{details['requestBody'].get('description', '')}\n\n"
-
-                    if details.get("responses"):
-                        doc += "### Responses\n\n"
-                        for status, response in details["responses"].items():
-                            doc += f"- `{status}`: {response.get('description', '')}\n"
-                        doc += "\n"
-
-            with open(output_file, "w") as f:
-                f.write(doc)
+            self._ensure_parsed()
+            doc = self.template_env.get_template("docs.md.jinja2").render(
+                info=self.api_data["info"],
+                paths=self.api_data["paths"],
+                resolve=self.parser.resolve,
+                # Path items also hold shared keys such as "parameters" and
+                # "servers"; document operations only, like the mock server.
+                http_methods=_HTTP_METHODS,
+            )
+            atomic_write_bytes(output_file, doc.encode("utf-8"))
 
             # Convert Markdown to HTML
-            html = markdown2.markdown(doc)
-            with open(f"{output_file}.html", "w") as f:
-                f.write(html)
+            html = _render_markdown(doc)
+            atomic_write_bytes(f"{output_file}.html", html.encode("utf-8"))
 
             self.logger.info(
                 f"API documentation generated successfully: {output_file} and {output_file}.html"
@@ -152,32 +303,48 @@ class APIGenerator:
             self.logger.error(f"Error generating API documentation: {str(e)}")
             raise ConfigurationError(f"Failed to generate API documentation: {str(e)}")
 
-    @staticmethod
-    def to_camel_case(string: str) -> str:
-        """Convert a string to camelCase."""
-        words = string.split("_")
-        return words[0] + "".join(word.capitalize() for word in words[1:])
+    # Identifier conversion is memoized at module level: the same parameter
+    # names recur across endpoints and specs.
+    to_camel_case = staticmethod(_to_camel_case)
+    to_snake_case = staticmethod(_to_snake_case)
 
     @staticmethod
-    def to_snake_case(string: str) -> str:
-        """Convert a string to snake_case."""
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", string).lower()
+    def split_path(path: str) -> Tuple[List[str], List[str]]:
+        """
+        Split a path template into its literal segments and parameter names.
+
+        "/pets/{petId}/toys" becomes (["/pets/", "/toys"], ["petId"]), so the
+        segments interleave with the parameters and there is always one more
+        segment than there are parameters.
+        """
+        parts = _PATH_PARAM_RE.split(path)
+        return parts[0::2], parts[1::2]
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Return the process-wide pooled session used by _request.
+        """
+        return await _get_shared_session()
 
-    @sleep_and_retry
-    @limits(calls=5, period=1)  # 5 calls per second
     async def _request(
-        self, session: aiohttp.ClientSession, method: str, url: str, **kwargs
+        self,
+        method: str,
+        url: str,
+        session: "Optional[aiohttp.ClientSession]" = None,
+        **kwargs,
     ) -> Any:
         """
         Make an HTTP request with rate limiting, retries, throttling, and error handling.
         """
+        await self._bucket.acquire()
+        session = session or await self._get_session()
         headers = kwargs.get("headers", {})
         headers.update(self.custom_headers)
         kwargs["headers"] = headers
         retries = 3
         for attempt in range(retries):
             try:
-                self.throttler.throttle(url)
+                await self.throttler.athrottle(url)
                 async with session.request(method, url, **kwargs) as response:
                     response.raise_for_status()
                     result = await response.json()
@@ -221,47 +388,34 @@ class APIGenerator:
             body_param = f"data: {body_type}"
             params.append(body_param)
 
-        response_type = self.parser.get_response_type(details["responses"])
-        docstring = (
-            f'"""\n    {details["summary"]}\n\n    {details["description"]}\n    """'
+        if self._endpoint_template is None:
+            self._endpoint_template = self.template_env.get_template(
+                "endpoint_method.py.jinja2"
+            )
+        return self._endpoint_template.render(
+            method_name=method_name,
+            params=params,
+            response_type=self.parser.get_response_type(details["responses"]),
+            summary=details["summary"],
+            description=details["description"],
+            path=path,
+            path_params=path_params,
+            query_params=query_params,
+            request_body=details["requestBody"] if body_param else None,
+            http_method=method.lower(),
         )
 
-        method_code = f"""
-    async def {method_name}(self, {', '.join(params)}) -> {response_type}:
-        {docstring}
-        path = f"{path}"
-        {''.join(f'.replace("{{{p}}}", str({p}))' for p in path_params)}
-        query = {{{', '.join(query_params)}}}
-        {'data = self.parser.validate_schema(data, ' + str(details['requestBody']['content']['application/json']['schema']) + ')' if body_param else ''}
-        return await self._request("{method.lower()}", path, params=query{',' if body_param else ''} {'json=data' if body_param else ''})
-    """
-        return method_code
-
     def generate_sync_client(self, output_file: str):
         """
         Generate a synchronous version of the API client.
         """
         try:
-            async_client_code = self.template_env.get_template(
-                "client.py.jinja2"
-            ).render(
-                api_info=self.parser.get_api_info(),
-                endpoints=self.parser.get_endpoints(),
-                servers=self.parser.get_servers(),
-                security_schemes=self.parser.get_security_schemes(),
-                tags=self.parser.get_tags(),
-                external_docs=self.parser.get_external_docs(),
-                parser=self.parser,
-                oauth_handler=self.oauth_handler,
-                pagination_handler=self.pagination_handler,
-                cache=self.cache,
-                webhook_handler=self.webhook_handler,
+            # sync=True makes the template emit the blocking HTTP/2 adapter,
+            # which the await-stripping conversion cannot derive.
+            chunks = self._get_client_template().generate(
+                **self._render_context(), sync=True
             )
-
-            sync_client_code = self._convert_to_sync(async_client_code)
-
-            with open(output_file, "w") as file:
-                file.write(sync_client_code)
+            atomic_write_chunks(output_file, self._convert_stream_to_sync(chunks))
 
             self.logger.info(
                 f"Synchronous API client generated successfully: {output_file}"
@@ -276,26 +430,28 @@ class APIGenerator:
         """
         Convert asynchronous code to synchronous code.
         """
-        # Replace async def with def
-        sync_code = re.sub(r"async def", "def", async_code)
-
-        # Replace await with synchronous equivalents
-        sync_code = re.sub(r"await (.*?)\(", r"\1(", sync_code)
-
-        # Replace aiohttp with requests
-        sync_code = sync_code.replace("import aiohttp", "import requests")
-        sync_code = sync_code.replace("aiohttp.ClientSession()", "requests.Session()")
-
-        # Replace async with statements
-        sync_code = re.sub(r"async with (.*?) as (.*?):", r"with \1 as \2:", sync_code)
+        return _SYNC_RE.sub(_sync_replacement, async_code)
 
-        return sync_code
+    def _convert_stream_to_sync(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Convert rendered chunks to synchronous code a batch of whole lines at a
+        time; every rewrite in _convert_to_sync is confined to a single line.
+        """
+        buffer = ""
+        for chunk in chunks:
+            buffer += chunk
+            lines, newline, buffer = buffer.rpartition("\n")
+            if newline:
+                yield self._convert_to_sync(lines + newline)
+        if buffer:
+            yield self._convert_to_sync(buffer)
 
     def generate_js_client(self, output_file: str):
         """
         Generate a JavaScript client based on the API specification.
         """
         try:
+            self._ensure_parsed()
             self.js_generator.generate(self.api_data, output_file)
             self.logger.info(
                 f"JavaScript API client generated successfully: {output_file}"
@@ -306,6 +462,45 @@ class APIGenerator:
                 f"Failed to generate JavaScript API client: {str(e)}"
             )
 
+    async def generate_all(
+        self, output_dir: str, prefix: str = "", js: bool = True
+    ):
+        """
+        Generate the async and sync clients, mock server, documentation and
+        (optionally) the JavaScript client into output_dir concurrently.
+
+        Every output name is prefixed with prefix, so prefix="github_" writes
+        github_client.py, github_api_docs.md and so on.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        # Parse, resolve endpoints and load the client template up front so
+        # the worker threads only render and write.
+        self._render_context()
+        self._get_client_template()
+
+        def output(name: str) -> str:
+            return os.path.join(output_dir, prefix + name)
+
+        jobs = [
+            (self.generate, output("client.py")),
+            (self.generate_sync_client, output("sync_client.py")),
+            (self.generate_mock_server, output("mock_server")),
+            (self.generate_documentation, output("api_docs.md")),
+        ]
+        if js:
+            jobs.append((self.generate_js_client, output("js_client.js")))
+
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            await asyncio.gather(
+                *(loop.run_in_executor(executor, fn, path) for fn, path in jobs)
+            )
+
+    async def close(self):
+        """Release the network resources held by the runtime helpers."""
+        await self.oauth_handler.close()
+        await self.webhook_handler.close()
+
     def execute_plugin(self, plugin_name: str, *args, **kwargs):
         """Execute a plugin by name."""
         return plugin_manager.execute_plugin(plugin_name, *args, **kwargs)
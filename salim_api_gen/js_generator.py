@@ -1,14 +1,21 @@
 import os
 import jinja2
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from .utils import atomic_write_chunks
 
 
 class JavaScriptGenerator:
-    def __init__(self, template_dir: str = None):
+    def __init__(
+        self,
+        template_dir: Optional[str] = None,
+        template_env: Optional[jinja2.Environment] = None,
+    ):
         self.template_dir = template_dir or os.path.join(
             os.path.dirname(__file__), "templates"
         )
-        self.template_env = jinja2.Environment(
+        # APIGenerator passes its own environment so both generators share
+        # one template cache; a standalone generator builds its own.
+        self.template_env = template_env or jinja2.Environment(
             loader=jinja2.FileSystemLoader(self.template_dir),
             trim_blocks=True,
             lstrip_blocks=True,
@@ -16,10 +23,9 @@ class JavaScriptGenerator:
 
     def generate(self, api_data: Dict[str, Any], output_file: str):
         template = self.template_env.get_template("js_client.js.jinja2")
-        rendered_code = template.render(
+        chunks = template.generate(
             api_info=api_data["info"],
             endpoints=api_data["paths"],
         )
 
-        with open(output_file, "w") as file:
-            file.write(rendered_code)
+        atomic_write_chunks(output_file, chunks)
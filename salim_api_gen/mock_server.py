@@ -1,53 +1,112 @@
+import functools
 import os
-from typing import Dict, Any
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+import re
+from typing import TYPE_CHECKING, Dict, Any, Optional, Set
+import jinja2
+from .utils import atomic_write_chunks
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+_TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+_NON_IDENTIFIER_RE = re.compile(r"\W+")
+_HTTP_METHODS = frozenset(
+    {"get", "post", "put", "delete", "patch", "options", "head", "trace"}
+)
+
+
+async def _mock_endpoint():
+    return {"message": "This is a mock response"}
+
+
+@functools.lru_cache(maxsize=1)
+def _mock_server_template() -> jinja2.Template:
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(_TEMPLATE_DIR),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+    return env.get_template("mock_server.py.jinja2")
 
 
 class MockServerGenerator:
+    def __init__(self, template_env: Optional[jinja2.Environment] = None):
+        # APIGenerator passes its own environment so a custom template
+        # directory and the shared bytecode cache apply to the mock server;
+        # a standalone generator falls back to the built-in template.
+        self.template_env = template_env
+
+    def _template(self) -> jinja2.Template:
+        if self.template_env is None:
+            return _mock_server_template()
+        return self.template_env.get_template("mock_server.py.jinja2")
+
     def generate(self, api_data: Dict[str, Any], output_dir: str):
+        # FastAPI is only imported when a mock server is actually generated.
+        from fastapi import FastAPI
+
         app = FastAPI(
             title=api_data["info"]["title"], version=api_data["info"]["version"]
         )
 
+        names: Set[str] = set()
         for path, path_item in api_data["paths"].items():
             for method, operation in path_item.items():
-                self.add_endpoint(app, method, path, operation)
+                # Path items may also carry shared "parameters", "summary", etc.
+                if method.lower() not in _HTTP_METHODS:
+                    continue
+                self.add_endpoint(app, method, path, operation, names)
 
         self.save_mock_server(app, output_dir)
 
     def add_endpoint(
-        self, app: FastAPI, method: str, path: str, operation: Dict[str, Any]
+        self,
+        app: "FastAPI",
+        method: str,
+        path: str,
+        operation: Dict[str, Any],
+        names: Set[str] = None,
     ):
-        async def mock_endpoint():
-            return JSONResponse(content={"message": "This is a mock response"})
+        from fastapi.responses import JSONResponse
+
+        # add_api_route registers the route directly, skipping the decorator
+        # round trip, and the mock routes stay out of the OpenAPI schema.
+        app.add_api_route(
+            path,
+            _mock_endpoint,
+            methods=[method.upper()],
+            name=self._route_name(method, path, operation, names),
+            include_in_schema=False,
+            response_class=JSONResponse,
+        )
+
+    @staticmethod
+    def _route_name(
+        method: str, path: str, operation: Dict[str, Any], names: Set[str] = None
+    ) -> str:
+        """
+        Derive a unique Python identifier for the generated route function.
+        """
+        base = operation.get("operationId") or f"{method}_{path}"
+        base = _NON_IDENTIFIER_RE.sub("_", base).strip("_") or method.lower()
+        if base[0].isdigit():
+            base = f"_{base}"
+        name = base
+        if names is not None:
+            counter = 2
+            while name in names:
+                name = f"{base}_{counter}"
+                counter += 1
+            names.add(name)
+        return name
 
-        getattr(app, method.lower())(path)(mock_endpoint)
+    def save_mock_server(self, app: "FastAPI", output_dir: str):
+        from fastapi.routing import APIRoute
 
-    def save_mock_server(self, app: FastAPI, output_dir: str):
         os.makedirs(output_dir, exist_ok=True)
-        with open(os.path.join(output_dir, "mock_server.py"), "w") as f:
-            f.write(
-                f"""
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-
-app = FastAPI(title="{app.title}", version="{app.version}")
-
-{self.generate_endpoint_code(app)}
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
-"""
-            )
-
-    def generate_endpoint_code(self, app: FastAPI) -> str:
-        endpoint_code = ""
-        for route in app.routes:
-            endpoint_code += f"""
-@app.{route.methods[0].lower()}("{route.path}")
-async def {route.name}():
-    return JSONResponse(content={{"message": "This is a mock response"}})
-"""
-        return endpoint_code
+        chunks = self._template().generate(
+            title=app.title,
+            version=app.version,
+            routes=[route for route in app.routes if isinstance(route, APIRoute)],
+        )
+        atomic_write_chunks(os.path.join(output_dir, "mock_server.py"), chunks)
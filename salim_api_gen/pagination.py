@@ -1,16 +1,44 @@
-from typing import Dict, Any, List, Callable
+import asyncio
+from typing import Dict, Any, List, Callable, AsyncIterator
 
 
 class PaginationHandler:
     def __init__(self):
         self.next_page_token: str = ""
 
-    async def paginate(self, request_func: Callable, **kwargs) -> List[Dict[str, Any]]:
-        all_results = []
-        while True:
-            response = await request_func(**kwargs, page_token=self.next_page_token)
-            all_results.extend(response.get("results", []))
-            self.next_page_token = response.get("next_page_token")
-            if not self.next_page_token:
-                break
-        return all_results
+    async def paginate(
+        self, request_func: Callable, **kwargs
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield results page by page, requesting the next page while the caller
+        is still consuming the current one.
+
+        Every call starts from the first page. next_page_token is updated only
+        once a page's items have all been yielded, so it never runs ahead of
+        what the caller has actually consumed.
+        """
+        token = ""
+        pending = asyncio.ensure_future(request_func(**kwargs, page_token=token))
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+                token = response.get("next_page_token") or ""
+                if token:
+                    pending = asyncio.ensure_future(
+                        request_func(**kwargs, page_token=token)
+                    )
+                for item in response.get("results", ()):
+                    yield item
+                self.next_page_token = token
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def paginate_all(
+        self, request_func: Callable, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect every page into a single list.
+        """
+        return [item async for item in self.paginate(request_func, **kwargs)]
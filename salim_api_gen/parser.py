@@ -1,9 +1,248 @@
 from abc import ABC, abstractmethod
+import functools
+import mmap
+import os
+import sys
+from urllib.parse import unquote
 import yaml
 import json
-from typing import Dict, Any, List, Optional
-from jsonschema import validate, ValidationError
-import ramlfications
+from .utils import _LONG_DIGITS_RE, _loads_json
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from ._parser_fast import walk_pointer as _walk_pointer
+except ImportError:
+
+    def _walk_pointer(root: Dict[str, Any], ref: str) -> Any:
+        """
+        Follow a local reference such as "#/components/schemas/Pet" from root.
+
+        The fragment is a percent-encoded RFC 6901 JSON pointer: "~1" and "~0"
+        stand for "/" and "~", and numeric tokens index into lists. Missing
+        keys and non-container nodes resolve to an empty dict.
+        """
+        if "%" in ref:
+            ref = unquote(ref)
+        node: Any = root
+        for part in ref.split("/")[1:]:
+            if "~" in part:
+                part = part.replace("~1", "/").replace("~0", "~")
+            if isinstance(node, dict):
+                node = node.get(part, {})
+            elif (
+                isinstance(node, list)
+                and part.isascii()
+                and part.isdigit()
+                and int(part) < len(node)
+            ):
+                node = node[int(part)]
+            else:
+                node = {}
+        return node
+
+
+def _escape_pointer_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+# JSON specs at least this large are streamed with ijson (when installed),
+# keeping only the top-level sections the generators read.
+_STREAM_THRESHOLD = 8 * 1024 * 1024
+# Specs at least this large are parsed straight out of a read-only memory map
+# instead of being copied into a bytes object first; below it the extra
+# syscalls cost more than the copy they save.
+_MMAP_THRESHOLD = 512 * 1024
+_SPEC_SECTIONS = frozenset(
+    {
+        "openapi",
+        "swagger",
+        "info",
+        "servers",
+        "paths",
+        "components",
+        "security",
+        "tags",
+        "externalDocs",
+    }
+)
+# Lower-case operation keys mapped to the interned upper-case method used in
+# "GET /path" endpoint keys.
+_HTTP_METHODS = {
+    method: sys.intern(method.upper())
+    for method in ("get", "post", "put", "delete", "patch", "options", "head")
+}
+
+
+def _load_yaml(path: str, size: int) -> Dict[str, Any]:
+    if size >= _MMAP_THRESHOLD:
+        with _mmap_bytes(path) as mm:
+            return yaml.load(mm, Loader=_Loader)
+    with open(path, "rb") as file:
+        return yaml.load(file.read(), Loader=_Loader)
+
+
+def _load_json(path: str, size: int) -> Dict[str, Any]:
+    if ijson is not None and size >= _STREAM_THRESHOLD:
+        return _stream_json_spec(path)
+    if orjson is not None and size >= _MMAP_THRESHOLD:
+        with _mmap_bytes(path) as mm:
+            # Specs orjson cannot decode exactly take the json path below.
+            if not _LONG_DIGITS_RE.search(mm):
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    pass
+                finally:
+                    view.release()
+    with open(path, "rb") as file:
+        data = file.read()
+    return _loads_json(data)
+
+
+_LOADERS = {
+    "yaml": _load_yaml,
+    "yml": _load_yaml,
+    "json": _load_json,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _load_spec(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Load a specification file, memoized on its path, modification time and size.
+
+    The returned dictionary is shared between callers and must not be mutated.
+    """
+    file_extension = path.rpartition(".")[2].lower()
+    loader = _LOADERS.get(file_extension)
+    if loader is None:
+        raise ValueError(f"Unsupported file format: {file_extension}")
+    return loader(path, size)
+
+
+def _mmap_bytes(path: str) -> mmap.mmap:
+    """
+    Map a file read-only so parsers can read it from the page cache directly.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+def _stream_json_spec(path: str) -> Dict[str, Any]:
+    """
+    Build only the sections of a JSON spec the generators use, one top-level
+    section at a time, so unused sections such as vendor extensions are never
+    held in memory alongside the rest of the document.
+    """
+    try:
+        with open(path, "rb") as file:
+            return {
+                key: value
+                for key, value in ijson.kvitems(file, "", use_float=True)
+                if key in _SPEC_SECTIONS
+            }
+    except ijson.JSONError as e:
+        raise ValueError(f"Error parsing specification file: {str(e)}")
+
+
+_TYPE_MAP = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "array": "List[{0}]",
+    "object": "Dict[str, Any]",
+}
+
+
+def _scalar_type(schema: Dict[str, Any]) -> str:
+    """
+    Type for a schema without nested items or properties to infer.
+    """
+    if "type" not in schema:
+        return "Any"
+    if "enum" in schema:
+        return f"Literal[{', '.join(repr(e) for e in schema['enum'])}]"
+    if "$ref" in schema:
+        return schema["$ref"].split("/")[-1]
+    return _TYPE_MAP.get(schema["type"], "Any")
+
+
+class EndpointView(NamedTuple):
+    """
+    Flattened, read-only view of one endpoint for template rendering.
+
+    Parameter fields are parallel tuples, so a template reads them by
+    position instead of looking up keys in one dict per parameter.
+    """
+
+    key: str
+    method: str
+    path: str
+    name: str
+    summary: str
+    description: str
+    param_names: Tuple[str, ...]
+    param_ins: Tuple[str, ...]
+    param_schemas: Tuple[Dict[str, Any], ...]
+    request_body: Dict[str, Any]
+    responses: Dict[str, Any]
+
+
+def _endpoint_name(details: Dict[str, Any], path: str) -> str:
+    # Only a missing operationId falls back to the path; an empty one is kept,
+    # as the client template's default() filter did.
+    operation_id = details.get("operationId")
+    if operation_id is None:
+        return path.split("/")[-1].lower()
+    return operation_id
+
+
+def build_endpoint_views(
+    endpoints: Dict[str, Dict[str, Any]]
+) -> List[EndpointView]:
+    """
+    Build an EndpointView for every "METHOD /path" entry of get_endpoints().
+    """
+    views = []
+    for key, details in endpoints.items():
+        method, _, path = key.partition(" ")
+        parameters = details.get("parameters") or ()
+        views.append(
+            EndpointView(
+                key=key,
+                method=method.lower(),
+                path=path,
+                name=_endpoint_name(details, path),
+                summary=details.get("summary", ""),
+                description=details.get("description", ""),
+                param_names=tuple(param["name"] for param in parameters),
+                param_ins=tuple(param.get("in", "") for param in parameters),
+                param_schemas=tuple(param.get("schema", {}) for param in parameters),
+                request_body=details.get("requestBody") or {},
+                responses=details.get("responses") or {},
+            )
+        )
+    return views
 
 
 class BaseSpecParser(ABC):
@@ -19,6 +258,13 @@ class BaseSpecParser(ABC):
     def get_endpoints(self) -> Dict[str, Dict[str, Any]]:
         pass
 
+    def resolve(self, obj: Any) -> Any:
+        """
+        Return the object a reference points to; formats without references
+        return obj unchanged.
+        """
+        return obj
+
 
 class OpenAPIParser(BaseSpecParser):
     def __init__(self, spec_file: str, api_version: Optional[str] = None):
@@ -26,27 +272,27 @@ class OpenAPIParser(BaseSpecParser):
         self.api_version = api_version
         self.spec_data: Dict[str, Any] = {}
         self.components: Dict[str, Any] = {}
+        self._endpoints: Optional[Dict[str, Dict[str, Any]]] = None
+        self._api_info: Optional[Dict[str, str]] = None
+        self._ref_cache: Dict[str, Any] = {}
 
     def parse(self) -> Dict[str, Any]:
         """
         Parse the OpenAPI specification file and return the data as a dictionary.
         """
-        file_extension = self.spec_file.split(".")[-1].lower()
-
         try:
-            with open(self.spec_file, "r") as file:
-                if file_extension in ["yaml", "yml"]:
-                    self.spec_data = yaml.safe_load(file)
-                elif file_extension == "json":
-                    self.spec_data = json.load(file)
-                else:
-                    raise ValueError(f"Unsupported file format: {file_extension}")
+            path = os.path.abspath(self.spec_file)
+            st = os.stat(path)
+            self.spec_data = _load_spec(path, st.st_mtime_ns, st.st_size)
         except FileNotFoundError:
             raise FileNotFoundError(f"Specification file not found: {self.spec_file}")
         except (yaml.YAMLError, json.JSONDecodeError) as e:
             raise ValueError(f"Error parsing specification file: {str(e)}")
 
         self.components = self.spec_data.get("components", {})
+        self._endpoints = None
+        self._api_info = None
+        self._ref_cache = self._build_ref_index()
         if self.api_version:
             self.spec_data = self._filter_by_version(self.spec_data)
         return self.spec_data
@@ -63,6 +309,8 @@ class OpenAPIParser(BaseSpecParser):
                     filtered_methods[method] = details
             if filtered_methods:
                 filtered_paths[path] = filtered_methods
+        # Copy rather than mutate: spec_data may be shared through _load_spec.
+        spec_data = dict(spec_data)
         spec_data["paths"] = filtered_paths
         return spec_data
 
@@ -70,8 +318,11 @@ class OpenAPIParser(BaseSpecParser):
         """
         Extract basic API information from the parsed specification.
         """
+        if self._api_info is not None:
+            return self._api_info
+
         info = self.spec_data.get("info", {})
-        return {
+        self._api_info = {
             "title": info.get("title", ""),
             "version": info.get("version", ""),
             "description": info.get("description", ""),
@@ -79,6 +330,7 @@ class OpenAPIParser(BaseSpecParser):
             "contact": info.get("contact", {}),
             "license": info.get("license", {}),
         }
+        return self._api_info
 
     def get_servers(self) -> List[Dict[str, str]]:
         """
@@ -90,23 +342,19 @@ class OpenAPIParser(BaseSpecParser):
         """
         Extract endpoint information from the parsed specification.
         """
+        if self._endpoints is not None:
+            return self._endpoints
+
         endpoints = {}
         paths = self.spec_data.get("paths", {})
 
         for path, methods in paths.items():
             for method, details in methods.items():
-                if method.lower() not in [
-                    "get",
-                    "post",
-                    "put",
-                    "delete",
-                    "patch",
-                    "options",
-                    "head",
-                ]:
+                http_method = _HTTP_METHODS.get(method.lower())
+                if http_method is None:
                     continue
 
-                endpoint_key = f"{method.upper()} {path}"
+                endpoint_key = sys.intern(f"{http_method} {path}")
                 endpoints[endpoint_key] = {
                     "summary": details.get("summary", ""),
                     "description": details.get("description", ""),
@@ -122,6 +370,7 @@ class OpenAPIParser(BaseSpecParser):
                     "tags": details.get("tags", []),
                 }
 
+        self._endpoints = endpoints
         return endpoints
 
     def _process_parameters(
@@ -130,81 +379,128 @@ class OpenAPIParser(BaseSpecParser):
         """
         Process and resolve parameter references.
         """
-        processed_params = []
-        for param in parameters:
-            if "$ref" in param:
-                ref_path = param["$ref"].split("/")
-                ref_param = self.components
-                for path in ref_path[1:]:
-                    ref_param = ref_param.get(path, {})
-                processed_params.append(ref_param)
-            else:
-                processed_params.append(param)
-        return processed_params
+        return [self.resolve(param) for param in parameters]
 
     def _process_request_body(self, request_body: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process and resolve request body references.
         """
-        if "$ref" in request_body:
-            ref_path = request_body["$ref"].split("/")
-            ref_body = self.components
-            for path in ref_path[1:]:
-                ref_body = ref_body.get(path, {})
-            return ref_body
-        return request_body
+        return self.resolve(request_body)
 
     def _process_responses(self, responses: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process and resolve response references.
         """
-        processed_responses = {}
-        for status_code, response in responses.items():
-            if "$ref" in response:
-                ref_path = response["$ref"].split("/")
-                ref_response = self.components
-                for path in ref_path[1:]:
-                    ref_response = ref_response.get(path, {})
-                processed_responses[status_code] = ref_response
-            else:
-                processed_responses[status_code] = response
-        return processed_responses
+        return {
+            status_code: self.resolve(response)
+            for status_code, response in responses.items()
+        }
 
-    def infer_type(self, schema: Dict[str, Any]) -> str:
+    def resolve(self, obj: Any) -> Any:
         """
-        Infer the Python type from an OpenAPI schema.
+        Return the object a {"$ref": ...} points to, or obj itself otherwise.
         """
-        if "type" not in schema:
-            return "Any"
+        if isinstance(obj, dict) and "$ref" in obj:
+            return self._resolve_ref(obj["$ref"])
+        return obj
 
-        type_mapping = {
-            "string": "str",
-            "integer": "int",
-            "number": "float",
-            "boolean": "bool",
-            "array": "List[{0}]",
-            "object": "Dict[str, Any]",
-        }
+    def _build_ref_index(self) -> Dict[str, Any]:
+        """
+        Map every "#/components/<kind>/<name>" pointer to its object.
 
-        if schema["type"] == "array" and "items" in schema:
-            item_type = self.infer_type(schema["items"])
-            return type_mapping["array"].format(item_type)
+        Nearly all references in practice point at a component, so seeding the
+        reference cache with them turns most lookups into one dict access.
+        Components that are themselves references are left for _resolve_ref
+        so chains and cycles are still followed and detected.
+        """
+        index: Dict[str, Any] = {}
+        for kind, entries in self.components.items():
+            if not isinstance(entries, dict):
+                continue
+            prefix = f"#/components/{kind}/"
+            for name, value in entries.items():
+                if not (isinstance(value, dict) and "$ref" in value):
+                    index[prefix + _escape_pointer_token(name)] = value
+        return index
+
+    def _resolve_ref(self, ref: str) -> Any:
+        """
+        Resolve a local reference such as "#/components/schemas/Pet".
 
-        if schema["type"] == "object" and "properties" in schema:
-            properties = []
-            for prop_name, prop_schema in schema["properties"].items():
-                prop_type = self.infer_type(prop_schema)
-                properties.append(f'"{prop_name}": {prop_type}')
-            return f"Dict[{', '.join(properties)}]"
+        Chained references are followed iteratively and every reference seen on
+        the way is memoized, so each pointer is walked at most once per parse.
+        """
+        if ref in self._ref_cache:
+            return self._ref_cache[ref]
+
+        chain: List[str] = []
+        target: Any = {"$ref": ref}
+        while isinstance(target, dict) and "$ref" in target:
+            current = target["$ref"]
+            if current in self._ref_cache:
+                target = self._ref_cache[current]
+                break
+            if current in chain:
+                raise ValueError(f"Circular reference detected: {current}")
+            chain.append(current)
+            target = _walk_pointer(self.spec_data, current)
+
+        for resolved_ref in chain:
+            self._ref_cache[resolved_ref] = target
+        return target
 
-        if "enum" in schema:
-            return f"Literal[{', '.join(repr(e) for e in schema['enum'])}]"
+    def infer_type(self, schema: Dict[str, Any]) -> str:
+        """
+        Infer the Python type from an OpenAPI schema.
 
-        if "$ref" in schema:
-            ref_type = schema["$ref"].split("/")[-1]
-            return ref_type
+        Nested array items and object properties are walked with an explicit
+        stack in post-order, so deeply nested schemas cannot exhaust the
+        interpreter's recursion limit. Results are keyed by id() so a
+        sub-schema shared by several properties is only inferred once.
+        """
+        results: Dict[int, str] = {}
+        pending = set()
+        stack = [(schema, False)]
+        while stack:
+            node, children_done = stack.pop()
+            key = id(node)
+            if not children_done and (key in results or key in pending):
+                if key not in results:
+                    # A schema that contains itself; give up on this branch.
+                    results[key] = "Any"
+                continue
+
+            node_type = node.get("type")
+            if node_type == "array" and "items" in node:
+                if children_done:
+                    pending.discard(key)
+                    results[key] = f"List[{results[id(node['items'])]}]"
+                else:
+                    pending.add(key)
+                    stack.append((node, True))
+                    stack.append((node["items"], False))
+                continue
+
+            if node_type == "object" and "properties" in node:
+                properties = node["properties"]
+                if children_done:
+                    pending.discard(key)
+                    results[key] = (
+                        "Dict["
+                        + ", ".join(
+                            f'"{name}": {results[id(prop)]}'
+                            for name, prop in properties.items()
+                        )
+                        + "]"
+                    )
+                else:
+                    pending.add(key)
+                    stack.append((node, True))
+                    stack.extend((prop, False) for prop in properties.values())
+                continue
 
-        return type_mapping.get(schema["type"], "Any")
+            results[key] = _scalar_type(node)
+        return results[id(schema)]
 
     def get_request_body_type(self, request_body: Dict[str, Any]) -> str:
         """
@@ -237,6 +533,8 @@ class OpenAPIParser(BaseSpecParser):
         """
         Validate data against a JSON schema.
         """
+        from jsonschema import validate, ValidationError
+
         try:
             validate(instance=data, schema=schema)
         except ValidationError as e:
@@ -285,6 +583,9 @@ class RAMLParser(BaseSpecParser):
         self.api = None
 
     def parse(self) -> Dict[str, Any]:
+        # ramlfications is slow to import and only needed for RAML specs.
+        import ramlfications
+
         try:
             self.api = ramlfications.parse(self.spec_file)
             return self._convert_to_openapi_structure()
@@ -346,7 +647,7 @@ class RAMLParser(BaseSpecParser):
         endpoints = {}
         for resource in self.api.resources:
             for method in resource.methods:
-                endpoint_key = f"{method.method.upper()} {resource.path}"
+                endpoint_key = sys.intern(f"{method.method.upper()} {resource.path}")
                 endpoints[endpoint_key] = {
                     "summary": method.description or "",
                     "parameters": self._get_parameters(method),
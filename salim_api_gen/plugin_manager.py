@@ -2,10 +2,24 @@ import importlib
 import os
 from typing import List, Dict, Any, Callable
 
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:  # Python 3.7
+    try:
+        import importlib_metadata
+    except ImportError:
+        importlib_metadata = None
+
+ENTRY_POINT_GROUP = "salim_api_gen.plugins"
+
 
 class PluginManager:
     def __init__(self):
         self.plugins: Dict[str, Callable] = {}
+        # Installed plugins found through package metadata; each is imported
+        # only when it is first requested.
+        self._entry_points: Dict[str, Any] = {}
+        self._discovered = False
 
     def load_plugins(self, plugin_dir: str):
         """Load all plugins from the specified directory."""
@@ -17,13 +31,47 @@ class PluginManager:
                     plugin_name = getattr(module, "PLUGIN_NAME", module_name)
                     self.plugins[plugin_name] = module.register_plugin
 
+    def discover_entry_points(self):
+        """
+        Register the plugins that installed packages advertise in the
+        "salim_api_gen.plugins" entry point group, without importing them.
+        """
+        self._discovered = True
+        if importlib_metadata is None:
+            return
+        entry_points = importlib_metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            group = entry_points.select(group=ENTRY_POINT_GROUP)
+        else:
+            group = entry_points.get(ENTRY_POINT_GROUP, ())
+        for entry_point in group:
+            if entry_point.name not in self.plugins:
+                self._entry_points.setdefault(entry_point.name, entry_point)
+
     def get_plugin(self, name: str) -> Callable:
         """Get a plugin by name."""
-        return self.plugins.get(name)
+        plugin = self.plugins.get(name)
+        if plugin is not None:
+            return plugin
+        if not self._discovered:
+            self.discover_entry_points()
+        entry_point = self._entry_points.get(name)
+        if entry_point is None:
+            return None
+        # Only forget the entry point once it has loaded, so a failing import
+        # is raised again on the next lookup instead of hiding the plugin.
+        plugin = entry_point.load()
+        # An entry point may name the plugin module or its register_plugin.
+        plugin = getattr(plugin, "register_plugin", plugin)
+        self.plugins[name] = plugin
+        del self._entry_points[name]
+        return plugin
 
     def list_plugins(self) -> List[str]:
         """List all available plugins."""
-        return list(self.plugins.keys())
+        if not self._discovered:
+            self.discover_entry_points()
+        return list(self.plugins.keys()) + list(self._entry_points.keys())
 
     def execute_plugin(self, name: str, *args, **kwargs) -> Any:
         """Execute a plugin by name."""
@@ -1,41 +1,85 @@
+import asyncio
+import sys
 import time
-from typing import Dict
+from collections import OrderedDict
+from typing import Optional
 
 
 class APIThrottler:
+    __slots__ = ("rate_limit", "time_period", "next_allowed_ns")
+
+    # Deadlines are kept for at most this many endpoints; the least recently
+    # throttled one is dropped first, so long-running clients that hit many
+    # distinct URLs do not grow the table without bound.
+    _MAX_ENDPOINTS = 4096
+
     def __init__(self, rate_limit: int, time_period: int):
         self.rate_limit = rate_limit
         self.time_period = time_period
-        self.request_times: Dict[str, float] = {}
+        # Earliest monotonic time, in nanoseconds, of the next request to
+        # each endpoint; calls at or after it proceed without sleeping.
+        self.next_allowed_ns: "OrderedDict[str, int]" = OrderedDict()
+
+    def _reserve(self, endpoint: str) -> int:
+        # Claim the endpoint's next slot before waiting for it, so concurrent
+        # callers queue up one period apart instead of all waking together.
+        endpoint = sys.intern(endpoint)
+        deadlines = self.next_allowed_ns
+        now = time.monotonic_ns()
+        start = max(now, deadlines.get(endpoint, 0))
+        deadlines[endpoint] = start + int(self.time_period * 1_000_000_000)
+        deadlines.move_to_end(endpoint)
+        if len(deadlines) > self._MAX_ENDPOINTS:
+            deadlines.popitem(last=False)
+        return start - now
 
     def throttle(self, endpoint: str):
-        current_time = time.time()
-        if endpoint in self.request_times:
-            time_passed = current_time - self.request_times[endpoint]
-            if time_passed < self.time_period:
-                time_to_wait = self.time_period - time_passed
-                time.sleep(time_to_wait)
+        wait_ns = self._reserve(endpoint)
+        if wait_ns > 0:
+            time.sleep(wait_ns / 1e9)
 
-        self.request_times[endpoint] = time.time()
+    async def athrottle(self, endpoint: str):
+        """
+        Like throttle, but waits with asyncio.sleep so the event loop keeps
+        running other tasks in the meantime.
+        """
+        wait_ns = self._reserve(endpoint)
+        if wait_ns > 0:
+            await asyncio.sleep(wait_ns / 1e9)
 
 
 class DynamicAPIThrottler(APIThrottler):
+    __slots__ = (
+        "successful_requests",
+        "failed_requests",
+        "_updates_since",
+        "_update_interval",
+    )
+
     def __init__(self, initial_rate_limit: int, initial_time_period: int):
         super().__init__(initial_rate_limit, initial_time_period)
         self.successful_requests = 0
         self.failed_requests = 0
+        # The rate limit is re-evaluated once every _update_interval calls
+        # rather than on every request.
+        self._updates_since = 0
+        self._update_interval = 32
 
     def update_rate_limit(self):
-        success_rate = (
-            self.successful_requests / (self.successful_requests + self.failed_requests)
-            if (self.successful_requests + self.failed_requests) > 0
-            else 1
-        )
-        if success_rate > 0.95:
+        self._updates_since += 1
+        if self._updates_since < self._update_interval:
+            return
+        self._updates_since = 0
+
+        successes = self.successful_requests
+        total = successes + self.failed_requests
+        # Integer forms of success_rate > 0.95 and success_rate < 0.8; with
+        # no requests recorded yet the success rate counts as 1.
+        if total == 0 or 20 * successes > 19 * total:
             self.rate_limit = min(
                 self.rate_limit * 2, 100
             )  # Increase rate limit, max 100 requests per period
-        elif success_rate < 0.8:
+        elif 5 * successes < 4 * total:
             self.rate_limit = max(
                 self.rate_limit // 2, 1
             )  # Decrease rate limit, min 1 request per period
@@ -44,8 +88,49 @@ class DynamicAPIThrottler(APIThrottler):
         super().throttle(endpoint)
         self.update_rate_limit()
 
+    async def athrottle(self, endpoint: str):
+        await super().athrottle(endpoint)
+        self.update_rate_limit()
+
     def record_request_result(self, success: bool):
         if success:
             self.successful_requests += 1
         else:
             self.failed_requests += 1
+
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter for coroutines.
+
+    Allows bursts of up to `rate` calls and refills at `rate` tokens every
+    `per` seconds. Callers that find the bucket empty wait with asyncio.sleep,
+    so other tasks keep running while they do.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.capacity = rate
+        self._tokens = float(rate)
+        self._fill_rate = rate / per
+        self._updated = time.monotonic()
+        # Created on first use: asyncio primitives bind to the running loop.
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self._fill_rate
+        )
+        self._updated = now
+
+    async def acquire(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock, self._loop = asyncio.Lock(), loop
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+                self._refill()
+            self._tokens -= 1
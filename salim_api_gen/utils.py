@@ -1,69 +1,228 @@
+import contextlib
+import copy
+import functools
 import os
-from typing import List, Dict, Any
+import re
+import stat
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterable, Iterator, List, Dict, Any, Union
 import yaml
 import json
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_OPENAPI_SUFFIXES = frozenset({"json", "yaml", "yml"})
+_SKIPPED_DIRS = frozenset({"__pycache__", "node_modules"})
+# orjson turns integers wider than 64 bits into floats; a run of 19 or more
+# digits may be one, so such documents are decoded by the json module.
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
 
 def ensure_directory(file_path: str) -> None:
     """
     Ensure that the directory for the given file path exists.
     """
     directory = os.path.dirname(file_path)
-    if directory and not os.path.exists(directory):
-        os.makedirs(directory)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+@contextlib.contextmanager
+def atomic_open(file_path: str, buffering: int = 1 << 20) -> Iterator[BinaryIO]:
+    """
+    Open file_path for binary writing, atomically.
+
+    Data goes to a temporary file in the same directory, which replaces
+    file_path only once the block completes, so readers never see a
+    half-written file and a failure leaves any previous file intact.
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    tmp_path = os.path.join(directory, f".{name}.{uuid.uuid4().hex[:8]}.tmp")
+    # os.open with 0o666 lets the umask pick a new file's permissions, as a
+    # plain open() would; a file being replaced keeps its current mode.
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb", buffering=buffering) as file:
+            yield file
+        try:
+            mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            pass
+        else:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_bytes(file_path: str, data: bytes) -> None:
+    """
+    Atomically replace file_path with data.
+    """
+    with atomic_open(file_path) as file:
+        file.write(data)
+
+
+def atomic_write_chunks(file_path: str, chunks: Iterable[Union[str, bytes]]) -> None:
+    """
+    Atomically replace file_path with the concatenated chunks.
+
+    Chunks are written as they are produced, so a large generated file is
+    never held in memory as a whole. Text chunks are encoded as UTF-8.
+    """
+    with atomic_open(file_path) as file:
+        write = file.write
+        for chunk in chunks:
+            write(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
 
 
-def list_openapi_files(directory: str) -> List[str]:
+def _scan_directory(directory: str, files: List[str], subdirs: List[str]) -> None:
+    # Hidden entries, __pycache__ and node_modules are skipped.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or name in _SKIPPED_DIRS:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            # rpartition avoids splitext's generic path handling; the dot
+            # check keeps a file literally named "json" from matching.
+            _, dot, suffix = name.rpartition(".")
+            if dot and suffix in _OPENAPI_SUFFIXES:
+                files.append(entry.path)
+
+
+def _scan_tree(directory: str) -> List[str]:
+    files: List[str] = []
+    stack = [directory]
+    while stack:
+        _scan_directory(stack.pop(), files, stack)
+    return files
+
+
+def list_openapi_files(directory: str, workers: int = 8) -> List[str]:
     """
     List all OpenAPI specification files (JSON or YAML) in the given directory.
+
+    Hidden entries, __pycache__ and node_modules are skipped. Each top-level
+    subdirectory is scanned on its own thread (up to workers at a time) so
+    that directory reads on slow or networked storage overlap.
     """
-    openapi_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith((".json", ".yaml", ".yml")):
-                openapi_files.append(os.path.join(root, file))
+    openapi_files: List[str] = []
+    subdirs: List[str] = []
+    _scan_directory(directory, openapi_files, subdirs)
+    if workers <= 1 or len(subdirs) <= 1:
+        for subdir in subdirs:
+            openapi_files.extend(_scan_tree(subdir))
+        return openapi_files
+    with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as executor:
+        for found in executor.map(_scan_tree, subdirs):
+            openapi_files.extend(found)
     return openapi_files
 
 
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path, "rb") as file:
+        return yaml.load(file, Loader=_Loader)
+
+
+def _loads_json(data: bytes) -> Any:
+    """
+    Decode JSON bytes with orjson where that is exact, else with json.
+
+    json also accepts NaN and Infinity, which orjson rejects.
+    """
+    if orjson is not None and not _LONG_DIGITS_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def load_yaml(file_path: str) -> Dict[str, Any]:
     """
     Load a YAML file and return its contents as a dictionary.
+
+    Each file is parsed once per process until it changes on disk.
     """
-    with open(file_path, "r") as file:
-        return yaml.safe_load(file)
+    # Keyed on modification time and size so an edited file is re-read. The
+    # cached document is copied because callers are free to mutate the result;
+    # for YAML the copy is still far cheaper than parsing again.
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    return copy.deepcopy(_load_yaml_cached(path, st.st_mtime_ns, st.st_size))
 
 
 def load_json(file_path: str) -> Dict[str, Any]:
     """
     Load a JSON file and return its contents as a dictionary.
     """
-    with open(file_path, "r") as file:
-        return json.load(file)
+    # Not cached: decoding JSON again is cheaper than deep-copying a cached
+    # document for every caller.
+    with open(file_path, "rb") as file:
+        data = file.read()
+    return _loads_json(data)
 
 
 def save_yaml(data: Dict[str, Any], file_path: str) -> None:
     """
     Save a dictionary as a YAML file.
     """
-    with open(file_path, "w") as file:
-        yaml.dump(data, file, default_flow_style=False)
+    # Dumping to bytes in one piece skips the text layer's per-chunk encoding.
+    data_bytes = yaml.dump(
+        data, Dumper=_Dumper, default_flow_style=False, encoding="utf-8"
+    )
+    with open(file_path, "wb") as file:
+        file.write(data_bytes)
 
 
 def save_json(data: Dict[str, Any], file_path: str) -> None:
     """
     Save a dictionary as a JSON file.
     """
-    with open(file_path, "w") as file:
-        json.dump(data, file, indent=2)
+    # json rather than orjson: orjson writes NaN as null, rejects integers
+    # wider than 64 bits and formats non-ASCII text and floats differently.
+    data_bytes = json.dumps(data, indent=2).encode("utf-8")
+    with open(file_path, "wb") as file:
+        file.write(data_bytes)
 
 
-def merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Merge two dictionaries recursively.
-    """
-    for key, value in dict2.items():
-        if isinstance(value, dict):
-            dict1[key] = merge_dicts(dict1.get(key, {}), value)
-        else:
-            dict1[key] = value
-    return dict1
+try:
+    from ._fastutils import merge_dicts
+except ImportError:
+
+    def merge_dicts(dict1: Dict[str, Any], dict2: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge two dictionaries recursively.
+
+        Nested dictionaries are walked with an explicit stack, so deeply nested
+        schemas cannot hit the recursion limit. Sub-dictionaries taken from dict2
+        are copied rather than shared with the result.
+        """
+        stack = [(dict1, dict2)]
+        pop, push, is_dict = stack.pop, stack.append, isinstance
+        while stack:
+            target, source = pop()
+            for key, value in source.items():
+                if is_dict(value, dict):
+                    existing = target.get(key)
+                    if not is_dict(existing, dict):
+                        existing = target[key] = {}
+                    push((existing, value))
+                else:
+                    target[key] = value
+        return dict1
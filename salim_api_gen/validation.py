@@ -1,19 +1,47 @@
+from collections import OrderedDict
 from typing import Any, Dict
 from .exceptions import ValidationError
 
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+_VALIDATOR_CACHE_SIZE = 128
+# id(schema) -> (schema, validator). Holding the schema keeps its id from being
+# reused by another object while the entry is cached.
+_validators: "OrderedDict[int, Any]" = OrderedDict()
+
+
+def _get_validator(schema: Dict[str, Any]) -> Any:
+    """
+    Return a compiled validator for the schema, building it on first use.
+    """
+    key = id(schema)
+    entry = _validators.get(key)
+    if entry is not None and entry[0] is schema:
+        _validators.move_to_end(key)
+        return entry[1]
+
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    _validators[key] = (schema, validator)
+    if len(_validators) > _VALIDATOR_CACHE_SIZE:
+        _validators.popitem(last=False)
+    return validator
+
 
 def validate_schema(data: Any, schema: Dict[str, Any]) -> None:
     """
     Validate data against a JSON schema.
     """
-    try:
-        import jsonschema
-    except ImportError:
+    if jsonschema is None:
         raise ImportError(
             "jsonschema is required for schema validation. Install it with 'pip install jsonschema'."
         )
 
     try:
-        jsonschema.validate(instance=data, schema=schema)
+        _get_validator(schema).validate(data)
     except jsonschema.exceptions.ValidationError as e:
         raise ValidationError(f"Schema validation failed: {e}")
@@ -1,19 +1,53 @@
-import aiohttp
-from typing import Dict, Any, List
+import sys
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Any, List, Optional
+
+if TYPE_CHECKING:
+    import aiohttp
 
 
 class WebhookHandler:
+    def __init__(self, base_url: str = ""):
+        self.base_url = base_url
+        self._session: "Optional[aiohttp.ClientSession]" = None
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        # Bulk registrations share one pooled session and its keep-alive
+        # connections rather than opening a new connector per call.
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+            )
+        return self._session
+
     async def register_webhook(
         self, webhook_url: str, events: List[str]
     ) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as session:
-            data = {"url": webhook_url, "events": events}
-            async with session.post(f"{self.base_url}/webhooks", json=data) as response:
-                response.raise_for_status()
-                return await response.json()
+        data = {"url": webhook_url, "events": events}
+        async with self._get_session().post(
+            f"{self.base_url}/webhooks", json=data
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    def register_handler(
+        self,
+        event_type: str,
+        handler: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """
+        Register the coroutine function that processes an event type.
+        """
+        self._handlers[sys.intern(event_type)] = handler
 
     async def process_webhook(self, payload: Dict[str, Any]) -> None:
-        event_type = payload.get("event_type")
-        if event_type:
-            # Process the webhook payload based on the event type
-            pass
+        handler = self._handlers.get(payload.get("event_type"))
+        if handler is not None:
+            await handler(payload)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
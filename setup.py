@@ -1,5 +1,20 @@
 from setuptools import setup, find_packages
 
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+# The compiled helpers are optional; without Cython the package installs as
+# pure Python and uses the fallbacks in parser.py and utils.py.
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        ["salim_api_gen/_parser_fast.pyx", "salim_api_gen/_fastutils.pyx"],
+        compiler_directives={"language_level": "3"},
+        quiet=True,
+    )
+
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
@@ -29,10 +44,10 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "pyyaml>=5.4,<7.0",
+        "orjson>=3.6,<4.0",
         "requests>=2.25,<3.0",
         "aiohttp>=3.7,<4.0",
         "jinja2>=2.11,<4.0",
-        "ratelimit>=2.2,<3.0",
         "jsonschema>=3.2,<5.0",
         "fastapi>=0.68.0,<1.0",
         "uvicorn>=0.15.0,<1.0",
@@ -81,6 +96,15 @@ setup(
         "pytest-clarity>=1.0.1,<2.0",
     ],
     extras_require={
+        "streaming": [
+            "ijson>=3.1,<4.0",
+        ],
+        "markdown-it": [
+            "markdown-it-py>=1.1,<4.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.19.0,<0.20",
+        ],
         "dev": [
             "pre-commit>=2.15.0,<3.0",
             "commitizen>=2.20.0,<3.0",
@@ -101,4 +125,5 @@ setup(
         "salim_api_gen": ["templates/*.jinja2"],
     },
     include_package_data=True,
+    ext_modules=ext_modules,
 )
@@ -1,12 +1,11 @@
+import asyncio
 from salim_api_gen import APIGenerator
 
 
 def generate_spotify_api_client():
     generator = APIGenerator("spotify_openapi.yaml")
-    generator.generate("spotify_client.py")
-    generator.generate_documentation("spotify_api_docs.md")
-    generator.generate_mock_server("spotify_mock_server")
-    generator.generate_sync_client("spotify_sync_client.py")
+    # One parse feeds every artifact; the outputs are rendered concurrently.
+    asyncio.run(generator.generate_all(".", prefix="spotify_", js=False))
 
 
 if __name__ == "__main__":
@@ -1,12 +1,11 @@
+import asyncio
 from salim_api_gen import APIGenerator
 
 
 def generate_stripe_api_client():
     generator = APIGenerator("stripe_openapi.yaml", api_version="2022-11-15")
-    generator.generate("stripe_client.py")
-    generator.generate_documentation("stripe_api_docs.md")
-    generator.generate_mock_server("stripe_mock_server")
-    generator.generate_sync_client("stripe_sync_client.py")
+    # One parse feeds every artifact; the outputs are rendered concurrently.
+    asyncio.run(generator.generate_all(".", prefix="stripe_", js=False))
 
 
 if __name__ == "__main__":
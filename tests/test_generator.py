@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import os
 import tempfile
 from salim_api_gen import APIGenerator
@@ -7,44 +7,11 @@ from salim_api_gen.exceptions import ConfigurationError
 
 
 class TestAPIGenerator(unittest.TestCase):
-    def setUp(self):
-        self.spec_file = "test_spec.yaml"
-        self.output_file = "test_output.py"
-        self.api_generator = APIGenerator(self.spec_file)
-
-    @patch("salim_api_gen.generator.OpenAPIParser")
-    def test_generate(self, mock_parser):
-        mock_parser.return_value.parse.return_value = {
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {"/test": {"get": {"summary": "Test endpoint"}}},
-        }
-        mock_parser.return_value.get_api_info.return_value = {
-            "title": "Test API",
-            "version": "1.0.0",
-        }
-        mock_parser.return_value.get_endpoints.return_value = {
-            "GET /test": {"summary": "Test endpoint"}
-        }
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_file = os.path.join(tmpdir, self.output_file)
-            self.api_generator.generate(output_file)
-            self.assertTrue(os.path.exists(output_file))
-
-    @patch("salim_api_gen.generator.OpenAPIParser")
-    def test_generate_mock_server(self, mock_parser):
-        mock_parser.return_value.parse.return_value = {
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {"/test": {"get": {"summary": "Test endpoint"}}},
-        }
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            self.api_generator.generate_mock_server(tmpdir)
-            self.assertTrue(os.path.exists(os.path.join(tmpdir, "mock_server.py")))
-
-    @patch("salim_api_gen.generator.OpenAPIParser")
-    def test_generate_documentation(self, mock_parser):
-        mock_parser.return_value.parse.return_value = {
+    @classmethod
+    def setUpClass(cls):
+        cls.spec_file = "test_spec.yaml"
+        cls.output_file = "test_output.py"
+        cls.PARSED = {
             "info": {
                 "title": "Test API",
                 "version": "1.0.0",
@@ -59,43 +26,85 @@ class TestAPIGenerator(unittest.TestCase):
                 }
             },
         }
+        cls.API_INFO = {"title": "Test API", "version": "1.0.0"}
+        cls.ENDPOINTS = {"GET /test": {"summary": "Test endpoint"}}
+        # Patch the parser factory once for the whole class; setUp hands each
+        # test a fresh parser mock so side effects never leak between tests.
+        cls._parser_patch = patch("salim_api_gen.generator.create_parser")
+        cls.mock_create_parser = cls._parser_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._parser_patch.stop()
+
+    def setUp(self):
+        self.mock_parser = MagicMock()
+        self.mock_parser.parse.return_value = self.PARSED
+        self.mock_parser.get_api_info.return_value = self.API_INFO
+        self.mock_parser.get_endpoints.return_value = self.ENDPOINTS
+        self.mock_parser.get_servers.return_value = []
+        self.mock_parser.resolve.side_effect = lambda obj: obj
+        self.mock_create_parser.return_value = self.mock_parser
+        self.api_generator = APIGenerator(self.spec_file)
+
+    def test_generate(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = os.path.join(tmpdir, self.output_file)
+            self.api_generator.generate(output_file)
+            self.assertTrue(os.path.exists(output_file))
+
+    def test_generate_mock_server(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.api_generator.generate_mock_server(tmpdir)
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "mock_server.py")))
 
+    def test_generate_documentation(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             output_file = os.path.join(tmpdir, "api_docs.md")
             self.api_generator.generate_documentation(output_file)
             self.assertTrue(os.path.exists(output_file))
             self.assertTrue(os.path.exists(output_file + ".html"))
 
-    @patch("salim_api_gen.generator.OpenAPIParser")
-    def test_generate_sync_client(self, mock_parser):
-        mock_parser.return_value.parse.return_value = {
-            "info": {"title": "Test API", "version": "1.0.0"},
-            "paths": {"/test": {"get": {"summary": "Test endpoint"}}},
-        }
-        mock_parser.return_value.get_api_info.return_value = {
-            "title": "Test API",
-            "version": "1.0.0",
-        }
-        mock_parser.return_value.get_endpoints.return_value = {
-            "GET /test": {"summary": "Test endpoint"}
+    def test_generate_documentation_skips_path_level_keys(self):
+        self.mock_parser.parse.return_value = {
+            "info": self.PARSED["info"],
+            "paths": {
+                "/test": {
+                    "summary": "Shared summary",
+                    "parameters": [{"name": "id", "in": "query"}],
+                    "get": {"summary": "Test endpoint"},
+                }
+            },
         }
 
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_file = os.path.join(tmpdir, "api_docs.md")
+            self.api_generator.generate_documentation(output_file)
+            with open(output_file) as f:
+                doc = f.read()
+        self.assertIn("## GET /test", doc)
+        self.assertNotIn("PARAMETERS /test", doc)
+
+    def test_generate_sync_client(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             output_file = os.path.join(tmpdir, "sync_client.py")
             self.api_generator.generate_sync_client(output_file)
             self.assertTrue(os.path.exists(output_file))
 
-    def test_invalid_spec_file(self):
-        with self.assertRaises(FileNotFoundError):
-            APIGenerator("nonexistent_file.yaml")
-
-    @patch("salim_api_gen.generator.OpenAPIParser")
-    def test_configuration_error(self, mock_parser):
-        mock_parser.return_value.parse.side_effect = ValueError("Invalid specification")
+    def test_configuration_error(self):
+        self.mock_parser.parse.side_effect = ValueError("Invalid specification")
 
         with self.assertRaises(ConfigurationError):
             self.api_generator.generate(self.output_file)
 
 
+class TestAPIGeneratorSpecFile(unittest.TestCase):
+    def test_invalid_spec_file(self):
+        # The spec is parsed lazily, on first use rather than in __init__.
+        api_generator = APIGenerator("nonexistent_file.yaml")
+        with self.assertRaises(FileNotFoundError):
+            api_generator.parsed_spec
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+import asyncio
+import unittest
+from salim_api_gen.pagination import PaginationHandler
+
+PAGES = {
+    "": {"results": [1, 2], "next_page_token": "p2"},
+    "p2": {"results": [3, 4], "next_page_token": "p3"},
+    "p3": {"results": [5], "next_page_token": None},
+}
+
+
+class TestPaginationHandler(unittest.TestCase):
+    def setUp(self):
+        self.handler = PaginationHandler()
+        self.requested = []
+
+    async def _fetch(self, page_token):
+        self.requested.append(page_token)
+        return PAGES[page_token]
+
+    def test_paginate_all_collects_every_page(self):
+        results = asyncio.run(self.handler.paginate_all(self._fetch))
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+        self.assertEqual(self.handler.next_page_token, "")
+        self.assertEqual(asyncio.run(self.handler.paginate_all(self._fetch)), results)
+
+    def test_breaking_early_does_not_skip_pages_later(self):
+        async def first_item():
+            pages = self.handler.paginate(self._fetch)
+            try:
+                async for item in pages:
+                    return item
+            finally:
+                await pages.aclose()
+
+        self.assertEqual(asyncio.run(first_item()), 1)
+        self.assertEqual(self.handler.next_page_token, "")
+        results = asyncio.run(self.handler.paginate_all(self._fetch))
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
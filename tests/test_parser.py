@@ -0,0 +1,125 @@
+import unittest
+import os
+import tempfile
+from salim_api_gen.parser import (
+    OpenAPIParser,
+    _load_spec,
+    _walk_pointer,
+    build_endpoint_views,
+)
+
+SPEC = """
+openapi: 3.0.0
+info:
+  title: Test API
+  version: 1.0.0
+  description: Test description
+paths:
+  /pets/{petId}:
+    get:
+      operationId: getPet
+      parameters:
+        - $ref: '#/components/parameters/PetId'
+      responses:
+        '200':
+          description: A pet
+components:
+  parameters:
+    PetId:
+      name: petId
+      in: path
+      required: true
+      schema:
+        type: integer
+"""
+
+
+class TestOpenAPIParser(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.spec_file = os.path.join(self.tmpdir.name, "spec.yaml")
+        with open(self.spec_file, "w") as f:
+            f.write(SPEC)
+        _load_spec.cache_clear()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_parse_reuses_cached_spec(self):
+        first = OpenAPIParser(self.spec_file).parse()
+        second = OpenAPIParser(self.spec_file).parse()
+        self.assertIs(first, second)
+        self.assertEqual(_load_spec.cache_info().hits, 1)
+
+    def test_parse_reloads_modified_spec(self):
+        first = OpenAPIParser(self.spec_file).parse()
+        with open(self.spec_file, "a") as f:
+            f.write("tags: []\n")
+        second = OpenAPIParser(self.spec_file).parse()
+        self.assertIsNot(first, second)
+        self.assertEqual(second["tags"], [])
+
+    def test_getters_are_memoized(self):
+        parser = OpenAPIParser(self.spec_file)
+        parser.parse()
+        self.assertIs(parser.get_endpoints(), parser.get_endpoints())
+        self.assertIs(parser.get_api_info(), parser.get_api_info())
+        self.assertEqual(
+            parser.get_endpoints()["GET /pets/{petId}"]["parameters"][0]["name"],
+            "petId",
+        )
+
+    def test_parse_resets_memoized_getters(self):
+        parser = OpenAPIParser(self.spec_file)
+        parser.parse()
+        endpoints = parser.get_endpoints()
+        parser.parse()
+        self.assertIsNot(parser.get_endpoints(), endpoints)
+
+    def test_infer_type_handles_deeply_nested_schemas(self):
+        schema = {"type": "string"}
+        for _ in range(2000):
+            schema = {"type": "array", "items": schema}
+        inferred = OpenAPIParser(self.spec_file).infer_type(schema)
+        self.assertEqual(inferred, "List[" * 2000 + "str" + "]" * 2000)
+
+    def test_infer_type_object_properties(self):
+        schema = {
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+            },
+        }
+        self.assertEqual(
+            OpenAPIParser(self.spec_file).infer_type(schema),
+            'Dict["id": int, "tags": List[str]]',
+        )
+
+    def test_resolve_ref_unescapes_json_pointer_tokens(self):
+        parser = OpenAPIParser(self.spec_file)
+        parser.parse()
+        self.assertEqual(
+            parser._resolve_ref("#/paths/~1pets~1%7BpetId%7D/get")["operationId"],
+            "getPet",
+        )
+
+    def test_endpoint_view_name_falls_back_only_without_operation_id(self):
+        views = build_endpoint_views(
+            {
+                "GET /pets/Owners": {},
+                "GET /toys": {"operationId": ""},
+                "GET /food": {"operationId": "listFood"},
+            }
+        )
+        self.assertEqual([view.name for view in views], ["owners", "", "listFood"])
+
+    def test_walk_pointer_treats_bad_list_indexes_as_missing(self):
+        root = {"a": [1, 2]}
+        self.assertEqual(_walk_pointer(root, "#/a/1"), 2)
+        self.assertEqual(_walk_pointer(root, "#/a/\u00b2"), {})
+        self.assertEqual(_walk_pointer(root, "#/a/" + "9" * 40), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from salim_api_gen.plugin_manager import PluginManager
+
+
+class _EntryPoint:
+    def __init__(self, name, target=None, error=None):
+        self.name = name
+        self.target = target
+        self.error = error
+
+    def load(self):
+        if self.error is not None:
+            raise self.error
+        return self.target
+
+
+class TestEntryPointPlugins(unittest.TestCase):
+    def setUp(self):
+        self.manager = PluginManager()
+        self.manager._discovered = True
+
+    def test_entry_point_loads_on_first_use(self):
+        def plugin():
+            return "ran"
+
+        self.manager._entry_points["demo"] = _EntryPoint("demo", plugin)
+        self.assertEqual(self.manager.execute_plugin("demo"), "ran")
+        self.assertEqual(self.manager.list_plugins(), ["demo"])
+
+    def test_failed_import_is_reported_again(self):
+        self.manager._entry_points["broken"] = _EntryPoint(
+            "broken", error=ImportError("missing dependency")
+        )
+        for _ in range(2):
+            with self.assertRaises(ImportError):
+                self.manager.get_plugin("broken")
+        self.assertEqual(self.manager.list_plugins(), ["broken"])
+
+
+if __name__ == "__main__":
+    unittest.main()
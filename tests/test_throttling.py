@@ -0,0 +1,97 @@
+import asyncio
+import time
+import unittest
+from salim_api_gen.throttling import (
+    APIThrottler,
+    AsyncTokenBucket,
+    DynamicAPIThrottler,
+)
+
+
+class TestAPIThrottler(unittest.TestCase):
+    def test_spaces_requests_to_the_same_endpoint(self):
+        throttler = APIThrottler(rate_limit=1, time_period=0.05)
+        start = time.monotonic()
+        throttler.throttle("/pets")
+        throttler.throttle("/pets")
+        self.assertGreaterEqual(time.monotonic() - start, 0.045)
+
+    def test_does_not_wait_for_other_endpoints(self):
+        throttler = APIThrottler(rate_limit=1, time_period=10)
+        start = time.monotonic()
+        throttler.throttle("/pets")
+        throttler.throttle("/users")
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_endpoint_table_is_bounded(self):
+        throttler = APIThrottler(rate_limit=1, time_period=0)
+        for i in range(APIThrottler._MAX_ENDPOINTS + 10):
+            throttler.throttle(f"/pets/{i}")
+        throttler.throttle("/pets/10")
+        self.assertEqual(len(throttler.next_allowed_ns), APIThrottler._MAX_ENDPOINTS)
+        self.assertNotIn("/pets/0", throttler.next_allowed_ns)
+        self.assertEqual(next(reversed(throttler.next_allowed_ns)), "/pets/10")
+
+    def test_athrottle_spaces_concurrent_callers(self):
+        throttler = APIThrottler(rate_limit=1, time_period=0.05)
+
+        async def call():
+            await throttler.athrottle("/pets")
+            return time.monotonic()
+
+        async def run():
+            return await asyncio.gather(*(call() for _ in range(3)))
+
+        times = sorted(asyncio.run(run()))
+        self.assertGreaterEqual(times[1] - times[0], 0.045)
+        self.assertGreaterEqual(times[2] - times[1], 0.045)
+
+
+class TestDynamicAPIThrottler(unittest.TestCase):
+    def _update(self, throttler, times):
+        for _ in range(times):
+            throttler.update_rate_limit()
+
+    def test_rate_limit_updates_once_per_interval(self):
+        throttler = DynamicAPIThrottler(initial_rate_limit=4, initial_time_period=1)
+        self._update(throttler, 31)
+        self.assertEqual(throttler.rate_limit, 4)
+        self._update(throttler, 1)
+        self.assertEqual(throttler.rate_limit, 8)
+
+    def test_rate_limit_follows_success_rate(self):
+        throttler = DynamicAPIThrottler(initial_rate_limit=8, initial_time_period=1)
+        throttler.successful_requests, throttler.failed_requests = 7, 3
+        self._update(throttler, 32)
+        self.assertEqual(throttler.rate_limit, 4)
+        throttler.successful_requests, throttler.failed_requests = 9, 1
+        self._update(throttler, 32)
+        self.assertEqual(throttler.rate_limit, 4)
+        throttler.successful_requests, throttler.failed_requests = 96, 4
+        self._update(throttler, 32)
+        self.assertEqual(throttler.rate_limit, 8)
+
+
+class TestAsyncTokenBucket(unittest.TestCase):
+    def test_burst_then_refill_rate(self):
+        bucket = AsyncTokenBucket(rate=4, per=0.2)
+
+        async def run():
+            start = time.monotonic()
+            for _ in range(6):
+                await bucket.acquire()
+            return time.monotonic() - start
+
+        elapsed = asyncio.run(run())
+        # Four calls fit in the initial burst; two more need 0.05s each.
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.5)
+
+    def test_usable_across_event_loops(self):
+        bucket = AsyncTokenBucket(rate=1, per=0.01)
+        asyncio.run(bucket.acquire())
+        asyncio.run(bucket.acquire())
+
+
+if __name__ == "__main__":
+    unittest.main()
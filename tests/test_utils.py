@@ -0,0 +1,149 @@
+import math
+import unittest
+import os
+import tempfile
+from salim_api_gen.utils import (
+    atomic_open,
+    atomic_write_bytes,
+    atomic_write_chunks,
+    list_openapi_files,
+    load_json,
+    load_yaml,
+    save_json,
+    merge_dicts,
+    _load_yaml_cached,
+)
+
+
+class TestAtomicWrites(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "out.py")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_atomic_write_bytes_replaces_file(self):
+        atomic_write_bytes(self.path, b"old")
+        atomic_write_bytes(self.path, b"new")
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"new")
+        self.assertEqual(os.listdir(self.tmpdir.name), ["out.py"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_new_file_follows_umask_and_existing_mode_is_kept(self):
+        umask = os.umask(0o022)
+        try:
+            atomic_write_bytes(self.path, b"old")
+        finally:
+            os.umask(umask)
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o644)
+        os.chmod(self.path, 0o755)
+        atomic_write_bytes(self.path, b"new")
+        self.assertEqual(os.stat(self.path).st_mode & 0o777, 0o755)
+
+    def test_failed_write_keeps_previous_file(self):
+        atomic_write_bytes(self.path, b"old")
+        with self.assertRaises(RuntimeError):
+            with atomic_open(self.path) as f:
+                f.write(b"partial")
+                raise RuntimeError("render failed")
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), b"old")
+        self.assertEqual(os.listdir(self.tmpdir.name), ["out.py"])
+
+    def test_atomic_write_chunks_mixes_text_and_bytes(self):
+        atomic_write_chunks(self.path, iter(["caf\u00e9 ", b"bytes", "\n"]))
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), "caf\u00e9 bytes\n".encode("utf-8"))
+
+
+class TestLoadCaching(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "spec.yaml")
+        with open(self.path, "w") as f:
+            f.write("info:\n  title: Test API\n")
+        _load_yaml_cached.cache_clear()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_load_yaml_parses_once_and_returns_copies(self):
+        first = load_yaml(self.path)
+        first["info"]["title"] = "changed"
+        second = load_yaml(self.path)
+        self.assertEqual(second["info"]["title"], "Test API")
+        self.assertEqual(_load_yaml_cached.cache_info().misses, 1)
+
+    def test_json_round_trip_is_exact(self):
+        path = os.path.join(self.tmpdir.name, "data.json")
+        data = {"big": 2 ** 70, "ratio": 1.5e20, "name": "caf\u00e9"}
+        save_json(data, path)
+        with open(path, "rb") as f:
+            self.assertIn(b"\\u00e9", f.read())
+        self.assertEqual(load_json(path), data)
+        with open(path, "w") as f:
+            f.write('{"value": NaN}')
+        self.assertTrue(math.isnan(load_json(path)["value"]))
+
+
+class TestMergeDicts(unittest.TestCase):
+    def test_merges_nested_dicts(self):
+        base = {"a": 1, "b": {"c": 2, "d": {"e": 3}}}
+        extra = {"b": {"d": {"f": 4}, "g": 5}, "h": {"i": 6}}
+        merged = merge_dicts(base, extra)
+        self.assertIs(merged, base)
+        self.assertEqual(
+            merged,
+            {"a": 1, "b": {"c": 2, "d": {"e": 3, "f": 4}, "g": 5}, "h": {"i": 6}},
+        )
+        self.assertIsNot(merged["h"], extra["h"])
+
+    def test_handles_deep_nesting(self):
+        deep = leaf = {}
+        for _ in range(5000):
+            leaf["x"] = {}
+            leaf = leaf["x"]
+        leaf["y"] = 1
+        merged = merge_dicts({}, deep)
+        for _ in range(5000):
+            merged = merged["x"]
+        self.assertEqual(merged, {"y": 1})
+
+
+class TestListOpenAPIFiles(unittest.TestCase):
+    def test_finds_specs_and_skips_hidden_and_vendor_dirs(self):
+        with tempfile.TemporaryDirectory() as root:
+            for path in (
+                "api.yaml",
+                "nested/deeper/api.json",
+                "nested/notes.txt",
+                ".hidden/api.yaml",
+                "node_modules/pkg/api.yml",
+            ):
+                full = os.path.join(root, path)
+                os.makedirs(os.path.dirname(full), exist_ok=True)
+                open(full, "w").close()
+            found = sorted(
+                os.path.relpath(p, root) for p in list_openapi_files(root)
+            )
+            self.assertEqual(
+                found, ["api.yaml", os.path.join("nested", "deeper", "api.json")]
+            )
+
+    def test_parallel_scan_matches_serial_scan(self):
+        with tempfile.TemporaryDirectory() as root:
+            for i in range(4):
+                full = os.path.join(root, f"svc{i}", "v1", "openapi.yaml")
+                os.makedirs(os.path.dirname(full))
+                open(full, "w").close()
+            self.assertEqual(
+                sorted(list_openapi_files(root, workers=4)),
+                sorted(list_openapi_files(root, workers=1)),
+            )
+            self.assertEqual(len(list_openapi_files(root)), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+from salim_api_gen.exceptions import ValidationError
+from salim_api_gen.validation import _get_validator, validate_schema
+
+
+class TestValidateSchema(unittest.TestCase):
+    SCHEMA = {
+        "type": "object",
+        "properties": {"id": {"type": "integer"}},
+        "required": ["id"],
+    }
+
+    def test_valid_and_invalid_data(self):
+        validate_schema({"id": 1}, self.SCHEMA)
+        with self.assertRaises(ValidationError):
+            validate_schema({"id": "one"}, self.SCHEMA)
+
+    def test_validator_is_reused_for_same_schema(self):
+        self.assertIs(_get_validator(self.SCHEMA), _get_validator(self.SCHEMA))
+        self.assertIsNot(_get_validator(self.SCHEMA), _get_validator(dict(self.SCHEMA)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import asyncio
+import unittest
+from salim_api_gen.webhook import WebhookHandler
+
+
+class TestWebhookDispatch(unittest.TestCase):
+    def test_dispatches_to_registered_handler(self):
+        handler = WebhookHandler()
+        received = []
+
+        async def on_created(payload):
+            received.append(payload)
+
+        handler.register_handler("created", on_created)
+
+        async def run():
+            await handler.process_webhook({"event_type": "created", "id": 1})
+            await handler.process_webhook({"event_type": "deleted", "id": 2})
+            await handler.process_webhook({"id": 3})
+
+        asyncio.run(run())
+        self.assertEqual(received, [{"event_type": "created", "id": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,11 @@
+import asyncio
 from salim_api_gen import APIGenerator
 
 
 def generate_twitter_api_client():
     generator = APIGenerator("twitter_openapi.yaml", api_version="2")
-    generator.generate("twitter_client.py")
-    generator.generate_documentation("twitter_api_docs.md")
-    generator.generate_mock_server("twitter_mock_server")
-    generator.generate_sync_client("twitter_sync_client.py")
+    # One parse feeds every artifact; the outputs are rendered concurrently.
+    asyncio.run(generator.generate_all(".", prefix="twitter_", js=False))
 
 
 if __name__ == "__main__":